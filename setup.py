@@ -45,6 +45,9 @@ setup(
         "toml": [
             "tomli>=1.2.0; python_version<'3.11'",  # TOML support for Python < 3.11
         ],
+        "fast-toml": [
+            "rtoml>=0.9.0",  # Optional Rust-backed TOML parser, preferred when installed
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.0.0",
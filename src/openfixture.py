@@ -29,14 +29,221 @@ import pcbnew
 import sys
 import os
 import wx
-import subprocess
 import logging
+import threading
+import time
+import traceback
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# GenFixture command-line options filled from get_parameters() keys
+_GENFIXTURE_ARGS = (
+    ('--board', 'board'),
+    ('--mat_th', 'mat_th'),
+    ('--pcb_th', 'pcb_th'),
+    ('--layer', 'layer'),
+    ('--rev', 'rev'),
+    ('--screw_len', 'screw_len'),
+    ('--screw_d', 'screw_d'),
+    ('--nut_th', 'nut_th'),
+    ('--nut_f2f', 'nut_f2f'),
+    ('--nut_c2c', 'nut_c2c'),
+    ('--washer_th', 'washer_th'),
+    ('--border', 'border'),
+    ('--pogo-uncompressed-length', 'pogo_length'),
+    ('--title', 'title'),
+)
+
+# GenFixture switches: (flag, get_parameters() key, default when key is absent)
+_GENFIXTURE_FLAGS = (
+    ('--verbose', 'verbose', False),
+    ('--include-smd', 'include_smd', True),
+    ('--include-pth', 'include_pth', True),
+)
+
+# Lines of GenFixture stdout/stderr kept for result and error reporting
+_OUTPUT_TAIL_LINES = 2000
+
+# User-facing messages for the GenFixture error categories
+_ERR_NO_TEST_POINTS = (
+    "No test points found on the PCB!\n\n"
+    "Test points must be:\n"
+    "• SMD pads\n"
+    "• Without solder paste mask\n"
+    "• On the selected layer (F.Cu, B.Cu, or both)\n\n"
+    "Tip: Use pad properties to remove paste mask.\n"
+    "Tip: Use Eco2.User layer to force include specific pads."
+)
+_ERR_OPENSCAD_MISSING = (
+    "OpenSCAD is not installed or not in PATH.\n\n"
+    "Please install OpenSCAD from:\n"
+    "https://openscad.org/downloads.html\n\n"
+    "After installation, add it to your PATH or install to:\n"
+    "C:\\Program Files\\OpenSCAD\\"
+)
+_ERR_BOARD_LOAD = (
+    "Failed to load the PCB file.\n\n"
+    "Possible causes:\n"
+    "• File is corrupted or not a valid KiCAD PCB file\n"
+    "• File is currently open in another application\n"
+    "• Insufficient permissions to read the file\n\n"
+    "Try saving the board and running the plugin again."
+)
+_ERR_IMPORT = (
+    "Python module import error.\n\n"
+    "This may indicate a KiCAD Python installation issue.\n"
+    "Try reinstalling or updating KiCAD to the latest version."
+)
+# Uncategorized - don't truncate, the full error is shown in the scrollable dialog
+_ERR_GENERIC = "An error occurred during fixture generation.\n\nSee details below for the full error message."
+
+# (keyword groups, message) in priority order - every group needs at least one
+# lowercase keyword present in the error text
+_ERROR_RULES = (
+    ((frozenset({"no test points found"}),), _ERR_NO_TEST_POINTS),
+    ((frozenset({"openscad"}), frozenset({"not found", "no such file"})), _ERR_OPENSCAD_MISSING),
+    ((frozenset({"failed to load board", "cannot open"}),), _ERR_BOARD_LOAD),
+    ((frozenset({"modulenotfounderror", "importerror"}),), _ERR_IMPORT),
+)
+
+# Common Python locations for KiCAD 9.0 / 8.0
+_PYTHON_PATHS = (
+    r"C:\Program Files\KiCad\9.0\bin\python.exe",
+    r"C:\Program Files\KiCad\8.0\bin\python.exe",
+    r"C:\Program Files\KiCad\bin\python.exe",
+)
+
+# Common OpenSCAD installation paths
+_OPENSCAD_PATHS = (
+    r"C:\Program Files\OpenSCAD\openscad.exe",
+    r"C:\Program Files (x86)\OpenSCAD\openscad.exe",
+)
+
+
+@lru_cache(maxsize=1)
+def _get_toml_loader():
+    """
+    Resolve the TOML parser once (tomllib on Python 3.11+, else tomli)
+    
+    A failed import is not cached by Python, so retrying tomllib on older
+    interpreters would search sys.path again on every config load.
+    
+    Returns:
+        The parser's load() function, or None if no parser is installed
+    """
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    return tomllib.load
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a fixture_config.toml file
+    
+    Cached on (path, mtime, size) so refreshing a reused dialog, or switching
+    back to a board, skips the TOML parse while the file is unchanged.
+    Raises ImportError if no TOML parser is installed.
+    """
+    toml_load = _get_toml_loader()
+    if toml_load is None:
+        raise ImportError("No TOML parser available (tomllib or tomli)")
+    
+    with open(path, 'rb') as f:
+        return toml_load(f)
+
+
+@lru_cache(maxsize=1)
+def _discover_python() -> str:
+    """Locate the Python interpreter used to run GenFixture (cached per session)"""
+    # Check if any of the known paths exist
+    path = next((p for p in _PYTHON_PATHS if os.path.exists(p)), None)
+    if path:
+        logger.info(f"Using Python: {path}")
+        return path
+    
+    # Fallback: check if sys.executable is actually Python
+    if 'python' in sys.executable.lower():
+        logger.info(f"Using Python from sys.executable: {sys.executable}")
+        return sys.executable
+    
+    # Last resort: try to find python in PATH
+    import shutil
+    python_path = shutil.which('python') or shutil.which('python3')
+    if python_path:
+        logger.info(f"Using Python from PATH: {python_path}")
+        return python_path
+    
+    # If all else fails, return sys.executable and hope for the best
+    logger.warning(f"Could not find Python, using sys.executable: {sys.executable}")
+    return sys.executable
+
+
+@lru_cache(maxsize=1)
+def _discover_genfixture(plugin_dir: Path):
+    """
+    Locate GenFixture.py relative to the plugin (cached per session)
+    
+    Returns:
+        Path to GenFixture.py, or None if it is not in any known location
+    """
+    # Search priority:
+    # 1. Same directory as plugin
+    # 2. openfixture_support subdirectory (for organized installations)
+    # 3. Parent directory (for development)
+    search_paths = (
+        plugin_dir / "GenFixture.py",
+        plugin_dir / "openfixture_support" / "GenFixture.py",
+        plugin_dir.parent / "GenFixture.py",
+    )
+    
+    for path in search_paths:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        logger.info(f"Found GenFixture.py at: {path}")
+        return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _discover_openscad() -> tuple:
+    """Locate OpenSCAD as (is_installed, path_or_error_message), cached per session"""
+    import shutil
+    
+    # Check known paths first
+    path = next((p for p in _OPENSCAD_PATHS if os.path.exists(p)), None)
+    if path:
+        logger.info(f"Found OpenSCAD at: {path}")
+        return True, path
+    
+    # Try to find OpenSCAD in PATH
+    openscad_path = shutil.which('openscad')
+    if openscad_path:
+        logger.info(f"Found OpenSCAD in PATH: {openscad_path}")
+        return True, openscad_path
+    
+    # Not found
+    error_msg = (
+        "OpenSCAD is not installed or not found.\n\n"
+        "OpenSCAD is required to generate 3D models and DXF files.\n\n"
+        "Please install OpenSCAD from:\n"
+        "https://openscad.org/downloads.html\n\n"
+        "After installation, restart KiCAD and try again."
+    )
+    return False, error_msg
+
 
 class ErrorDialog(wx.Dialog):
     """
@@ -99,7 +306,7 @@ class ErrorDialog(wx.Dialog):
         sizer.Add(ok_btn, 0, wx.ALL | wx.ALIGN_CENTER, 10)
         
         self.SetSizer(sizer)
-        self.Centre(wx.BOTH)
+        self.CentreOnParent(wx.BOTH)
     
     def _on_copy(self, event):
         """Copy error details to clipboard"""
@@ -109,12 +316,70 @@ class ErrorDialog(wx.Dialog):
             wx.MessageBox("Error details copied to clipboard", "Copied", wx.OK | wx.ICON_INFORMATION)
 
 
+class FloatValidator(wx.Validator):
+    """
+    Validator for numeric TextCtrl fields
+    
+    Rejects values that are not valid numbers when the dialog is confirmed,
+    so GenFixture is never launched with parameters it cannot parse.
+    """
+    
+    def Clone(self):
+        return FloatValidator()
+    
+    def Validate(self, parent):
+        ctrl = self.GetWindow()
+        try:
+            float(ctrl.GetValue())
+        except ValueError:
+            wx.MessageBox(
+                f"'{ctrl.GetValue()}' is not a valid number.",
+                "Invalid Value",
+                wx.OK | wx.ICON_WARNING
+            )
+            ctrl.SetFocus()
+            ctrl.SelectAll()
+            return False
+        return True
+    
+    def TransferToWindow(self):
+        return True
+    
+    def TransferFromWindow(self):
+        return True
+
+
 class OpenFixtureDialog(wx.Dialog):
     """
     Modern dialog for OpenFixture generation
     Replaces auto-generated OpenFixtureDlg with better UX
     """
     
+    # get_parameters() key -> widget attribute holding its value
+    _PARAM_WIDGETS = (
+        ('title', 'project_title'),
+        ('pcb_th', 'pcb_thickness'),
+        ('mat_th', 'material_thickness'),
+        ('rev', 'revision'),
+        ('screw_len', 'screw_length'),
+        ('screw_d', 'screw_diameter'),
+        ('nut_th', 'nut_thickness'),
+        ('nut_f2f', 'nut_f2f'),
+        ('nut_c2c', 'nut_c2c'),
+        ('washer_th', 'washer_thickness'),
+        ('border', 'border'),
+        ('pogo_length', 'pogo_length'),
+        ('output', 'output_text'),
+        ('verbose', 'verbose_logging'),
+        ('include_smd', 'include_smd'),
+        ('include_pth', 'include_pth'),
+    )
+    
+    # Shared fonts/colours, created on first dialog construction
+    _HEADER_FONT = None
+    _HELP_COLOUR = None
+    _CONFIG_COLOUR = None
+    
     def __init__(self, parent, board_path: str, board=None):
         wx.Dialog.__init__(
             self, 
@@ -131,8 +396,39 @@ class OpenFixtureDialog(wx.Dialog):
         self.board = board
         
         # Extract title and revision from KiCAD title block
-        self.extracted_title = self.board_name  # Default fallback to filename
-        self.extracted_revision = "rev_01"  # Default fallback
+        self.extracted_title, self.extracted_revision = self._read_title_block()
+        
+        # Numeric fields sit inside notebook pages - validate them on OK
+        self.SetExtraStyle(self.GetExtraStyle() | wx.WS_EX_VALIDATE_RECURSIVELY)
+        
+        # Track manual edits to output folder
+        self.output_manual_edit = False
+        
+        # Load configuration if available
+        self._find_config_file()
+        
+        # Built-in value of every created widget, used to reset a reused dialog
+        self._builtin_defaults = {}
+        
+        # Batch size/paint events while the widgets are created and filled in
+        self.Freeze()
+        try:
+            self._initial_values = self._load_defaults()
+            self._create_ui()
+        finally:
+            self.Thaw()
+        
+        self.CentreOnParent(wx.BOTH)
+    
+    def _read_title_block(self) -> tuple:
+        """
+        Extract title and revision from the KiCAD title block
+        
+        Returns:
+            (title, revision), falling back to the board file name and "rev_01"
+        """
+        title = self.board_name  # Default fallback to filename
+        revision = "rev_01"  # Default fallback
         if self.board:
             try:
                 title_block = self.board.GetTitleBlock()
@@ -140,52 +436,103 @@ class OpenFixtureDialog(wx.Dialog):
                 # Extract title
                 kicad_title = title_block.GetTitle()
                 if kicad_title and kicad_title.strip():
-                    self.extracted_title = kicad_title.strip()
-                    logger.info(f"Extracted title from title block: {self.extracted_title}")
+                    title = kicad_title.strip()
+                    logger.info(f"Extracted title from title block: {title}")
                 
                 # Extract revision
                 kicad_rev = title_block.GetRevision()
                 if kicad_rev and kicad_rev.strip():
                     # Clean up revision: remove spaces, ensure format
-                    self.extracted_revision = kicad_rev.strip().replace(" ", "_")
+                    revision = kicad_rev.strip().replace(" ", "_")
                     # Add "rev_" prefix if not present
-                    if not self.extracted_revision.lower().startswith("rev"):
-                        self.extracted_revision = f"rev_{self.extracted_revision}"
-                    logger.info(f"Extracted revision from title block: {self.extracted_revision}")
+                    if not revision.lower().startswith("rev"):
+                        revision = f"rev_{revision}"
+                    logger.info(f"Extracted revision from title block: {revision}")
             except Exception as e:
                 logger.warning(f"Could not extract title/revision from title block: {e}")
+        return title, revision
+    
+    def refresh(self, board) -> bool:
+        """
+        Prepare a reused dialog for another run on the same board
         
-        # Track manual edits to output folder
-        self.output_manual_edit = False
-        
-        # Load configuration if available
-        self.config_path = None
-        self._find_config_file()
+        Re-reads the title block and reloads fixture_config.toml (a cache hit
+        unless the file changed), then resets every field to its initial value.
         
-        self._create_ui()
-        self._load_defaults()
+        Args:
+            board: Current pcbnew board object
         
-        self.Centre(wx.BOTH)
+        Returns:
+            False if the config file appeared or disappeared since the dialog
+            was built (the caller must rebuild it), True once the fields are reset
+        """
+        self.board = board
+        had_config = self.config_path
+        self._find_config_file()
+        if self.config_path != had_config:
+            # The "Config:" header line only exists when a config was found
+            return False
+        self._initial_values = self._load_defaults()
+        
+        self.extracted_title, self.extracted_revision = self._read_title_block()
+        values = dict(self._builtin_defaults)
+        values.update(self._initial_values)
+        values['project_title'] = self.extracted_title
+        values['revision'] = self.extracted_revision
+        values['output_text'] = f"fixture-{self.extracted_revision}"
+        
+        for attr, value in values.items():
+            # Widgets of pages not built yet pick up _initial_values when built
+            ctrl = getattr(self, attr, None)
+            if ctrl is None:
+                continue
+            if isinstance(value, bool):
+                ctrl.SetValue(value)
+            else:
+                # ChangeValue: no EVT_TEXT, so the output folder is not marked as edited
+                ctrl.ChangeValue(value)
+        self.output_manual_edit = False
+        return True
+    
+    def _initial_value(self, attr: str, default):
+        """Initial value for a new widget: config value if present, else the built-in default"""
+        self._builtin_defaults[attr] = default
+        return self._initial_values.get(attr, default)
     
     def _find_config_file(self):
         """Search for fixture_config.toml in project directory"""
+        self.config_path = None
+        self._config_stat = None
         board_dir = Path(self.board_path).parent
         config_file = board_dir / "fixture_config.toml"
         
-        if config_file.exists():
-            self.config_path = str(config_file)
-            logger.info(f"Found configuration file: {self.config_path}")
+        # One stat both detects the file and keys the parsed-config cache
+        try:
+            self._config_stat = os.stat(config_file)
+        except OSError:
+            return
+        self.config_path = str(config_file)
+        logger.info(f"Found configuration file: {self.config_path}")
+    
+    @classmethod
+    def _init_style_cache(cls, ref_widget):
+        """Create the shared fonts and colours once per session"""
+        if cls._HELP_COLOUR is not None:
+            return
+        header_font = ref_widget.GetFont()
+        header_font.PointSize += 2
+        cls._HEADER_FONT = header_font.Bold()
+        cls._HELP_COLOUR = wx.Colour(100, 100, 100)
+        cls._CONFIG_COLOUR = wx.Colour(0, 128, 0)
     
     def _create_ui(self):
         """Create dialog UI"""
+        self._init_style_cache(self)
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Header
         header = wx.StaticText(self, wx.ID_ANY, "Generate Test Fixture")
-        header_font = header.GetFont()
-        header_font.PointSize += 2
-        header_font = header_font.Bold()
-        header.SetFont(header_font)
+        header.SetFont(self._HEADER_FONT)
         main_sizer.Add(header, 0, wx.ALL | wx.EXPAND, 10)
         
         # Board info
@@ -205,7 +552,7 @@ class OpenFixtureDialog(wx.Dialog):
         
         if self.config_path:
             config_info = wx.StaticText(self, wx.ID_ANY, f"Config: {Path(self.config_path).name}")
-            config_info.SetForegroundColour(wx.Colour(0, 128, 0))
+            config_info.SetForegroundColour(self._CONFIG_COLOUR)
             main_sizer.Add(config_info, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, 10)
         
         # Notebook for organized parameters
@@ -215,17 +562,18 @@ class OpenFixtureDialog(wx.Dialog):
         board_panel = self._create_board_panel(notebook)
         notebook.AddPage(board_panel, "Board")
         
-        # Material Panel
-        material_panel = self._create_material_panel(notebook)
-        notebook.AddPage(material_panel, "Material")
-        
-        # Hardware Panel
-        hardware_panel = self._create_hardware_panel(notebook)
-        notebook.AddPage(hardware_panel, "Hardware")
-        
-        # Advanced Panel
-        advanced_panel = self._create_advanced_panel(notebook)
-        notebook.AddPage(advanced_panel, "Advanced")
+        # Material, Hardware and Advanced pages start empty and are filled
+        # in the first time they are selected (or when parameters are read)
+        self._page_builders = {}
+        for title, builder in (
+            ("Material", self._create_material_panel),
+            ("Hardware", self._create_hardware_panel),
+            ("Advanced", self._create_advanced_panel),
+        ):
+            page = wx.Panel(notebook)
+            self._page_builders[notebook.GetPageCount()] = (page, builder)
+            notebook.AddPage(page, title)
+        notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self._on_page_changed)
         
         main_sizer.Add(notebook, 1, wx.ALL | wx.EXPAND, 10)
         
@@ -247,6 +595,7 @@ class OpenFixtureDialog(wx.Dialog):
         
         generate_btn = wx.Button(self, wx.ID_OK, "Generate Fixture")
         generate_btn.SetDefault()
+        generate_btn.Bind(wx.EVT_BUTTON, self._on_generate)
         button_sizer.AddButton(generate_btn)
         
         cancel_btn = wx.Button(self, wx.ID_CANCEL, "Cancel")
@@ -258,6 +607,29 @@ class OpenFixtureDialog(wx.Dialog):
         self.SetSizer(main_sizer)
         self.Layout()
     
+    def _add_rows(self, panel, sizer, rows, numeric: bool = True):
+        """
+        Add "label: [text]" rows to a panel sizer
+        
+        Args:
+            panel: Parent panel for the new widgets
+            sizer: Vertical sizer receiving one horizontal row per entry
+            rows: Sequence of (label, attribute name, default value)
+            numeric: Attach a FloatValidator to each TextCtrl
+        """
+        for label, attr, default in rows:
+            row_sizer = wx.BoxSizer(wx.HORIZONTAL)
+            row_sizer.Add(wx.StaticText(panel, wx.ID_ANY, label), 0,
+                          wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+            if numeric:
+                ctrl = wx.TextCtrl(panel, wx.ID_ANY, self._initial_value(attr, default),
+                                   validator=FloatValidator())
+            else:
+                ctrl = wx.TextCtrl(panel, wx.ID_ANY, self._initial_value(attr, default))
+            row_sizer.Add(ctrl, 1, wx.ALL, 5)
+            sizer.Add(row_sizer, 0, wx.EXPAND)
+            setattr(self, attr, ctrl)
+    
     def _create_board_panel(self, parent):
         """Create board parameters panel"""
         panel = wx.Panel(parent)
@@ -266,25 +638,16 @@ class OpenFixtureDialog(wx.Dialog):
         # PCB thickness
         sizer.Add(wx.StaticText(panel, wx.ID_ANY, "PCB Parameters:"), 0, wx.ALL, 5)
         
-        thickness_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        thickness_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Thickness (mm):"), 0, 
-                          wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.pcb_thickness = wx.TextCtrl(panel, wx.ID_ANY, "1.6")
-        thickness_sizer.Add(self.pcb_thickness, 1, wx.ALL, 5)
-        sizer.Add(thickness_sizer, 0, wx.EXPAND)
-        
-        # Revision
-        rev_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        rev_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Revision:"), 0,
-                     wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.revision = wx.TextCtrl(panel, wx.ID_ANY, self.extracted_revision)
-        rev_sizer.Add(self.revision, 1, wx.ALL, 5)
+        self._add_rows(panel, sizer, (
+            ("Thickness (mm):", "pcb_thickness", "1.6"),
+        ))
+        self._add_rows(panel, sizer, (
+            ("Revision:", "revision", self.extracted_revision),
+        ), numeric=False)
         
         # Bind event to auto-update output folder
         self.revision.Bind(wx.EVT_TEXT, self._on_revision_changed)
         
-        sizer.Add(rev_sizer, 0, wx.EXPAND)
-        
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
         # Test point layer
@@ -292,7 +655,8 @@ class OpenFixtureDialog(wx.Dialog):
         
         self.layer_top = wx.CheckBox(panel, wx.ID_ANY, "Top Layer (F.Cu)")
         self.layer_bottom = wx.CheckBox(panel, wx.ID_ANY, "Bottom Layer (B.Cu)")
-        self.layer_top.SetValue(True)
+        self.layer_top.SetValue(self._initial_value('layer_top', True))
+        self.layer_bottom.SetValue(self._initial_value('layer_bottom', False))
         
         # Bind events for mutual exclusion (radio button behavior)
         self.layer_top.Bind(wx.EVT_CHECKBOX, self._on_layer_top_checked)
@@ -307,11 +671,11 @@ class OpenFixtureDialog(wx.Dialog):
         sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Pad Types to Include:"), 0, wx.ALL, 5)
         
         self.include_smd = wx.CheckBox(panel, wx.ID_ANY, "SMD pads (surface mount test points)")
-        self.include_smd.SetValue(True)
+        self.include_smd.SetValue(self._initial_value('include_smd', True))
         sizer.Add(self.include_smd, 0, wx.ALL, 5)
         
         self.include_pth = wx.CheckBox(panel, wx.ID_ANY, "PTH pads (through-hole pins/connectors)")
-        self.include_pth.SetValue(True)
+        self.include_pth.SetValue(self._initial_value('include_pth', True))
         sizer.Add(self.include_pth, 0, wx.ALL, 5)
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
@@ -326,26 +690,22 @@ class OpenFixtureDialog(wx.Dialog):
             "NOTE: Select ONE side only (Top OR Bottom).\n"
             "Physical fixture supports single-sided testing.\n"
             "PTH pads allow testing connectors from opposite side.")
-        help_text.SetForegroundColour(wx.Colour(100, 100, 100))
+        help_text.SetForegroundColour(self._HELP_COLOUR)
         sizer.Add(help_text, 0, wx.ALL, 10)
         
         panel.SetSizer(sizer)
         return panel
     
-    def _create_material_panel(self, parent):
-        """Create material parameters panel"""
-        panel = wx.Panel(parent)
+    def _create_material_panel(self, panel):
+        """Fill the material parameters page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Laser Cut Material:"), 0, wx.ALL, 5)
         
         # Material thickness
-        mat_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        mat_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Thickness (mm):"), 0,
-                     wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.material_thickness = wx.TextCtrl(panel, wx.ID_ANY, "3.0")
-        mat_sizer.Add(self.material_thickness, 1, wx.ALL, 5)
-        sizer.Add(mat_sizer, 0, wx.EXPAND)
+        self._add_rows(panel, sizer, (
+            ("Thickness (mm):", "material_thickness", "3.0"),
+        ))
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
@@ -360,10 +720,15 @@ class OpenFixtureDialog(wx.Dialog):
             ("Plywood 5mm", "5.0"),
         ]
         
+        # One shared handler looks the thickness up by button ID
+        self._preset_thickness = {}
+        items = []
         for name, thickness in presets:
             btn = wx.Button(panel, wx.ID_ANY, name)
-            btn.Bind(wx.EVT_BUTTON, lambda evt, t=thickness: self.material_thickness.SetValue(t))
-            sizer.Add(btn, 0, wx.ALL | wx.EXPAND, 2)
+            self._preset_thickness[btn.GetId()] = thickness
+            btn.Bind(wx.EVT_BUTTON, self._on_preset)
+            items.append((btn, 0, wx.ALL | wx.EXPAND, 2))
+        sizer.AddMany(items)
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
@@ -372,59 +737,33 @@ class OpenFixtureDialog(wx.Dialog):
             "Measure material thickness with calipers.\n"
             "Laser-cut materials can vary ±0.1mm.\n"
             "Use test cut to verify fit before full cut.")
-        help_text.SetForegroundColour(wx.Colour(100, 100, 100))
+        help_text.SetForegroundColour(self._HELP_COLOUR)
         sizer.Add(help_text, 0, wx.ALL, 10)
         
         panel.SetSizer(sizer)
-        return panel
     
-    def _create_hardware_panel(self, parent):
-        """Create hardware parameters panel"""
-        panel = wx.Panel(parent)
+    def _create_hardware_panel(self, panel):
+        """Fill the hardware parameters page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Screw parameters
         sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Screw Parameters (M3 recommended):"), 0, wx.ALL, 5)
         
-        screw_len_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        screw_len_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Length (mm):"), 0,
-                           wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.screw_length = wx.TextCtrl(panel, wx.ID_ANY, "16.0")
-        screw_len_sizer.Add(self.screw_length, 1, wx.ALL, 5)
-        sizer.Add(screw_len_sizer, 0, wx.EXPAND)
-        
-        screw_dia_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        screw_dia_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Diameter (mm):"), 0,
-                           wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.screw_diameter = wx.TextCtrl(panel, wx.ID_ANY, "3.0")
-        screw_dia_sizer.Add(self.screw_diameter, 1, wx.ALL, 5)
-        sizer.Add(screw_dia_sizer, 0, wx.EXPAND)
+        self._add_rows(panel, sizer, (
+            ("Length (mm):", "screw_length", "16.0"),
+            ("Diameter (mm):", "screw_diameter", "3.0"),
+        ))
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
         # Nut parameters
         sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Hex Nut Parameters (M3):"), 0, wx.ALL, 5)
         
-        nut_th_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        nut_th_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Thickness (mm):"), 0,
-                        wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.nut_thickness = wx.TextCtrl(panel, wx.ID_ANY, "2.4")
-        nut_th_sizer.Add(self.nut_thickness, 1, wx.ALL, 5)
-        sizer.Add(nut_th_sizer, 0, wx.EXPAND)
-        
-        nut_f2f_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        nut_f2f_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Flat-to-Flat (mm):"), 0,
-                         wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.nut_f2f = wx.TextCtrl(panel, wx.ID_ANY, "5.45")
-        nut_f2f_sizer.Add(self.nut_f2f, 1, wx.ALL, 5)
-        sizer.Add(nut_f2f_sizer, 0, wx.EXPAND)
-        
-        nut_c2c_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        nut_c2c_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Corner-to-Corner (mm):"), 0,
-                         wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.nut_c2c = wx.TextCtrl(panel, wx.ID_ANY, "6.10")
-        nut_c2c_sizer.Add(self.nut_c2c, 1, wx.ALL, 5)
-        sizer.Add(nut_c2c_sizer, 0, wx.EXPAND)
+        self._add_rows(panel, sizer, (
+            ("Thickness (mm):", "nut_thickness", "2.4"),
+            ("Flat-to-Flat (mm):", "nut_f2f", "5.45"),
+            ("Corner-to-Corner (mm):", "nut_c2c", "6.10"),
+        ))
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
@@ -433,57 +772,64 @@ class OpenFixtureDialog(wx.Dialog):
             "Measure screw threaded length only (not head).\n"
             "Measure nut dimensions with calipers.\n"
             "Sizes vary by manufacturer!")
-        help_text.SetForegroundColour(wx.Colour(100, 100, 100))
+        help_text.SetForegroundColour(self._HELP_COLOUR)
         sizer.Add(help_text, 0, wx.ALL, 10)
         
         panel.SetSizer(sizer)
-        return panel
     
-    def _create_advanced_panel(self, parent):
-        """Create advanced parameters panel"""
-        panel = wx.Panel(parent)
+    def _create_advanced_panel(self, panel):
+        """Fill the advanced parameters page"""
         sizer = wx.BoxSizer(wx.VERTICAL)
         
-        # Washer
-        washer_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        washer_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Washer Thickness (mm):"), 0,
-                        wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.washer_thickness = wx.TextCtrl(panel, wx.ID_ANY, "1.0")
-        washer_sizer.Add(self.washer_thickness, 1, wx.ALL, 5)
-        sizer.Add(washer_sizer, 0, wx.EXPAND)
-        
-        # Border
-        border_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        border_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "PCB Support Border (mm):"), 0,
-                        wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.border = wx.TextCtrl(panel, wx.ID_ANY, "1.0")
-        border_sizer.Add(self.border, 1, wx.ALL, 5)
-        sizer.Add(border_sizer, 0, wx.EXPAND)
-        
-        # Pogo pin length
-        pogo_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        pogo_sizer.Add(wx.StaticText(panel, wx.ID_ANY, "Pogo Pin Length (mm):"), 0,
-                      wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
-        self.pogo_length = wx.TextCtrl(panel, wx.ID_ANY, "16.0")
-        pogo_sizer.Add(self.pogo_length, 1, wx.ALL, 5)
-        sizer.Add(pogo_sizer, 0, wx.EXPAND)
+        self._add_rows(panel, sizer, (
+            ("Washer Thickness (mm):", "washer_thickness", "1.0"),
+            ("PCB Support Border (mm):", "border", "1.0"),
+            ("Pogo Pin Length (mm):", "pogo_length", "16.0"),
+        ))
         
         sizer.Add(wx.StaticLine(panel), 0, wx.EXPAND | wx.ALL, 10)
         
         # Verbose logging checkbox
         self.verbose_logging = wx.CheckBox(panel, wx.ID_ANY, "Enable Verbose Logging (creates log file)")
-        self.verbose_logging.SetValue(False)
+        self.verbose_logging.SetValue(self._initial_value('verbose_logging', False))
         sizer.Add(self.verbose_logging, 0, wx.ALL, 10)
         
         # Help text
         help_text = wx.StaticText(panel, wx.ID_ANY,
             "Optional parameters for fine-tuning.\n"
             "Leave at defaults for most applications.")
-        help_text.SetForegroundColour(wx.Colour(100, 100, 100))
+        help_text.SetForegroundColour(self._HELP_COLOUR)
         sizer.Add(help_text, 0, wx.ALL, 10)
         
         panel.SetSizer(sizer)
-        return panel
+    
+    def _on_page_changed(self, event):
+        """Build a notebook page the first time it is selected"""
+        # CHANGED, not CHANGING: only here is GetSelection() the new page on every port
+        self._build_page(event.GetSelection())
+        event.Skip()
+    
+    def _on_generate(self, event):
+        """Build every deferred page so the dialog's OK handling validates all fields"""
+        self._build_all_pages()
+        event.Skip()
+    
+    def _build_all_pages(self):
+        """Fill the pages the user never opened - they still hold parameter widgets"""
+        for index in list(self._page_builders):
+            self._build_page(index)
+    
+    def _build_page(self, index: int):
+        """Fill a deferred notebook page (no-op if already built)"""
+        entry = self._page_builders.pop(index, None)
+        if entry:
+            page, builder = entry
+            builder(page)
+            page.Layout()
+    
+    def _on_preset(self, event):
+        """Apply a material preset thickness"""
+        self.material_thickness.SetValue(self._preset_thickness[event.GetId()])
     
     def _on_layer_top_checked(self, event):
         """Handle top layer checkbox - ensure mutual exclusion"""
@@ -523,118 +869,97 @@ class OpenFixtureDialog(wx.Dialog):
         if current_output != expected_output:
             self.output_manual_edit = True
     
-    def _load_defaults(self):
-        """Load default values from config file if available"""
-        if not self.config_path:
-            return
+    def _load_defaults(self) -> dict:
+        """
+        Load default values from config file if available
         
-        try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib
-            except ImportError:
-                return
+        Returns:
+            Dict of widget attribute name -> initial value, applied by the
+            page builders when the widget is created
+        """
+        values = {}
+        if not self.config_path:
+            return values
         
         try:
-            with open(self.config_path, 'rb') as f:
-                config = tomllib.load(f)
+            st = self._config_stat
+            config = _load_config_cached(self.config_path, st.st_mtime_ns, st.st_size)
             
             # Load board parameters
             if 'board' in config:
                 board = config['board']
                 if 'thickness_mm' in board:
-                    self.pcb_thickness.SetValue(str(board['thickness_mm']))
+                    values['pcb_thickness'] = str(board['thickness_mm'])
                 if 'test_layer' in board:
                     if board['test_layer'] == 'B.Cu':
-                        self.layer_top.SetValue(False)
-                        self.layer_bottom.SetValue(True)
+                        values['layer_top'] = False
+                        values['layer_bottom'] = True
                     # Note: 'both' mode not supported by physical fixture design
                     # If config specifies 'both', default to top layer
                     elif board['test_layer'] == 'both':
-                        self.layer_top.SetValue(True)
-                        self.layer_bottom.SetValue(False)
+                        values['layer_top'] = True
+                        values['layer_bottom'] = False
             
             # Load material parameters
             if 'material' in config:
                 material = config['material']
                 if 'thickness_mm' in material:
-                    self.material_thickness.SetValue(str(material['thickness_mm']))
+                    values['material_thickness'] = str(material['thickness_mm'])
             
             # Load hardware parameters
             if 'hardware' in config:
                 hw = config['hardware']
                 if 'screw_length_mm' in hw:
-                    self.screw_length.SetValue(str(hw['screw_length_mm']))
+                    values['screw_length'] = str(hw['screw_length_mm'])
                 if 'screw_diameter_mm' in hw:
-                    self.screw_diameter.SetValue(str(hw['screw_diameter_mm']))
+                    values['screw_diameter'] = str(hw['screw_diameter_mm'])
                 if 'nut_thickness_mm' in hw:
-                    self.nut_thickness.SetValue(str(hw['nut_thickness_mm']))
+                    values['nut_thickness'] = str(hw['nut_thickness_mm'])
                 if 'nut_flat_to_flat_mm' in hw:
-                    self.nut_f2f.SetValue(str(hw['nut_flat_to_flat_mm']))
+                    values['nut_f2f'] = str(hw['nut_flat_to_flat_mm'])
                 if 'nut_corner_to_corner_mm' in hw:
-                    self.nut_c2c.SetValue(str(hw['nut_corner_to_corner_mm']))
+                    values['nut_c2c'] = str(hw['nut_corner_to_corner_mm'])
                 if 'washer_thickness_mm' in hw:
-                    self.washer_thickness.SetValue(str(hw['washer_thickness_mm']))
+                    values['washer_thickness'] = str(hw['washer_thickness_mm'])
                 if 'border_mm' in hw:
-                    self.border.SetValue(str(hw['border_mm']))
+                    values['border'] = str(hw['border_mm'])
                 if 'pogo_uncompressed_length_mm' in hw:
-                    self.pogo_length.SetValue(str(hw['pogo_uncompressed_length_mm']))
+                    values['pogo_length'] = str(hw['pogo_uncompressed_length_mm'])
             
             # Load advanced/debugging parameters
             if 'advanced' in config:
                 advanced = config['advanced']
                 if 'verbose_logging' in advanced:
-                    self.verbose_logging.SetValue(bool(advanced['verbose_logging']))
+                    values['verbose_logging'] = bool(advanced['verbose_logging'])
             
             # Load test point detection parameters
             if 'test_points' in config:
                 tp = config['test_points']
                 if 'include_smd_pads' in tp:
-                    self.include_smd.SetValue(bool(tp['include_smd_pads']))
+                    values['include_smd'] = bool(tp['include_smd_pads'])
                 if 'include_pth_pads' in tp:
-                    self.include_pth.SetValue(bool(tp['include_pth_pads']))
+                    values['include_pth'] = bool(tp['include_pth_pads'])
             
             logger.info("Loaded defaults from configuration file")
             
+        except ImportError:
+            # No TOML parser available - keep built-in defaults
+            pass
         except Exception as e:
             logger.error(f"Error loading config: {e}")
+        
+        return values
     
     def get_parameters(self) -> dict:
         """Get all parameters from dialog"""
-        # Determine selected layer based on checkboxes (mutually exclusive)
-        top_checked = self.layer_top.GetValue()
-        bottom_checked = self.layer_bottom.GetValue()
-        
-        # Due to mutual exclusion, only one can be true at a time
-        if top_checked:
-            layer = 'F.Cu'
-        elif bottom_checked:
-            layer = 'B.Cu'
-        else:
-            # Fallback (should not happen with mutual exclusion)
-            layer = 'F.Cu'
-        
-        return {
-            'board': self.board_path,
-            'title': self.project_title.GetValue(),
-            'pcb_th': self.pcb_thickness.GetValue(),
-            'mat_th': self.material_thickness.GetValue(),
-            'rev': self.revision.GetValue(),
-            'layer': layer,
-            'screw_len': self.screw_length.GetValue(),
-            'screw_d': self.screw_diameter.GetValue(),
-            'nut_th': self.nut_thickness.GetValue(),
-            'nut_f2f': self.nut_f2f.GetValue(),
-            'nut_c2c': self.nut_c2c.GetValue(),
-            'washer_th': self.washer_thickness.GetValue(),
-            'border': self.border.GetValue(),
-            'pogo_length': self.pogo_length.GetValue(),
-            'output': self.output_text.GetValue(),
-            'verbose': self.verbose_logging.GetValue(),
-            'include_smd': self.include_smd.GetValue(),
-            'include_pth': self.include_pth.GetValue(),
-        }
+        self._build_all_pages()
+        
+        params = {key: getattr(self, attr).GetValue() for key, attr in self._PARAM_WIDGETS}
+        params['board'] = self.board_path
+        
+        # Checkboxes are mutually exclusive - top wins (and is the fallback)
+        params['layer'] = 'B.Cu' if self.layer_bottom.GetValue() and not self.layer_top.GetValue() else 'F.Cu'
+        return params
 
 
 class OpenFixturePlugin(pcbnew.ActionPlugin):
@@ -644,6 +969,11 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
     Generates laser-cuttable PCB test fixtures from KiCAD board files
     """
     
+    # Dialog is kept between runs for the same board (widgets are built once)
+    _dialog = None
+    # PCBNew frame found on the first run (a destroyed wx window evaluates False)
+    _pcb_frame = None
+    
     def defaults(self):
         """Set plugin metadata"""
         self.name = "OpenFixture Generator"
@@ -671,25 +1001,32 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
                 return
             
             # Get PCBNew frame
-            pcbnew_frame = None
-            for window in wx.GetTopLevelWindows():
-                if window.GetName() == 'PcbFrame':
-                    pcbnew_frame = window
-                    break
+            pcbnew_frame = self._pcb_frame
+            if not pcbnew_frame:
+                pcbnew_frame = wx.FindWindowByName('PcbFrame')
+                if not pcbnew_frame:
+                    for window in wx.GetTopLevelWindows():
+                        if window.GetName() == 'PcbFrame':
+                            pcbnew_frame = window
+                            break
+                self._pcb_frame = pcbnew_frame
             
             if not pcbnew_frame:
                 logger.error("Could not find PCBNew frame")
                 return
             
-            # Show dialog
-            dialog = OpenFixtureDialog(pcbnew_frame, board_path, board)
+            # Show dialog - reuse the previous one (reset to fresh values) unless
+            # the board or its config changed (a destroyed wx window evaluates False)
+            dialog = self._dialog
+            if not dialog or dialog.board_path != board_path or not dialog.refresh(board):
+                if dialog:
+                    dialog.Destroy()
+                dialog = self._dialog = OpenFixtureDialog(pcbnew_frame, board_path, board)
             
             if dialog.ShowModal() == wx.ID_OK:
                 params = dialog.get_parameters()
                 self._generate_fixture(params, pcbnew_frame)
             
-            dialog.Destroy()
-            
         except Exception as e:
             logger.error(f"Plugin error: {e}", exc_info=True)
             wx.MessageBox(
@@ -705,34 +1042,12 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         In KiCAD plugins, sys.executable may point to KiCAD itself,
         so we need to find the actual Python interpreter.
         """
-        # Try common Python locations for KiCAD 9.0
-        possible_paths = [
-            r"C:\Program Files\KiCad\9.0\bin\python.exe",
-            r"C:\Program Files\KiCad\8.0\bin\python.exe",
-            r"C:\Program Files\KiCad\bin\python.exe",
-        ]
-        
-        # Check if any of the known paths exist
-        for path in possible_paths:
-            if os.path.exists(path):
-                logger.info(f"Using Python: {path}")
-                return path
-        
-        # Fallback: check if sys.executable is actually Python
-        if 'python' in sys.executable.lower():
-            logger.info(f"Using Python from sys.executable: {sys.executable}")
-            return sys.executable
-        
-        # Last resort: try to find python in PATH
-        import shutil
-        python_path = shutil.which('python') or shutil.which('python3')
-        if python_path:
-            logger.info(f"Using Python from PATH: {python_path}")
-            return python_path
-        
-        # If all else fails, return sys.executable and hope for the best
-        logger.warning(f"Could not find Python, using sys.executable: {sys.executable}")
-        return sys.executable
+        python_exe = _discover_python()
+        if not os.path.isfile(python_exe):
+            # Interpreter removed or upgraded since it was cached - search again
+            _discover_python.cache_clear()
+            python_exe = _discover_python()
+        return python_exe
     
     def _check_openscad(self) -> tuple[bool, str]:
         """
@@ -741,35 +1056,7 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         Returns:
             tuple: (is_installed, path_or_error_message)
         """
-        import shutil
-        
-        # Common OpenSCAD installation paths
-        possible_paths = [
-            r"C:\Program Files\OpenSCAD\openscad.exe",
-            r"C:\Program Files (x86)\OpenSCAD\openscad.exe",
-        ]
-        
-        # Check known paths first
-        for path in possible_paths:
-            if os.path.exists(path):
-                logger.info(f"Found OpenSCAD at: {path}")
-                return True, path
-        
-        # Try to find OpenSCAD in PATH
-        openscad_path = shutil.which('openscad')
-        if openscad_path:
-            logger.info(f"Found OpenSCAD in PATH: {openscad_path}")
-            return True, openscad_path
-        
-        # Not found
-        error_msg = (
-            "OpenSCAD is not installed or not found.\n\n"
-            "OpenSCAD is required to generate 3D models and DXF files.\n\n"
-            "Please install OpenSCAD from:\n"
-            "https://openscad.org/downloads.html\n\n"
-            "After installation, restart KiCAD and try again."
-        )
-        return False, error_msg
+        return _discover_openscad()
     
     def _verify_output_files(self, output_dir: Path, prefix: str, layer: str = None) -> tuple[bool, list, list]:
         """
@@ -805,22 +1092,33 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         found_files = []
         missing_files = []
         
+        # Sizes of the non-empty candidate files, from a single directory read
+        wanted = set(expected_files).union(optional_files)
+        sizes = {}
+        try:
+            with os.scandir(output_dir) as it:
+                for entry in it:
+                    if entry.name in wanted and entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+                        if size > 0:
+                            sizes[entry.name] = size
+        except FileNotFoundError:
+            pass
+        
         # Check expected files
         for filename in expected_files:
-            filepath = output_dir / filename
-            if filepath.exists() and filepath.stat().st_size > 0:
+            if filename in sizes:
                 found_files.append(filename)
-                logger.info(f"Verified: {filename} ({filepath.stat().st_size} bytes)")
+                logger.info(f"Verified: {filename} ({sizes[filename]} bytes)")
             else:
                 missing_files.append(filename)
                 logger.warning(f"Missing or empty: {filename}")
         
         # Check optional files (log but don't require)
         for filename in optional_files:
-            filepath = output_dir / filename
-            if filepath.exists() and filepath.stat().st_size > 0:
+            if filename in sizes:
                 found_files.append(filename)
-                logger.info(f"Found optional: {filename} ({filepath.stat().st_size} bytes)")
+                logger.info(f"Found optional: {filename} ({sizes[filename]} bytes)")
         
         all_ok = len(missing_files) == 0
         return all_ok, found_files, missing_files
@@ -837,50 +1135,18 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         """
         error_lower = error_text.lower()
         
-        # Check for common errors
-        if "no test points found" in error_lower:
-            return (
-                "No test points found on the PCB!\n\n"
-                "Test points must be:\n"
-                "• SMD pads\n"
-                "• Without solder paste mask\n"
-                "• On the selected layer (F.Cu, B.Cu, or both)\n\n"
-                "Tip: Use pad properties to remove paste mask.\n"
-                "Tip: Use Eco2.User layer to force include specific pads."
-            )
-        
-        if "openscad" in error_lower and ("not found" in error_lower or "no such file" in error_lower):
-            return (
-                "OpenSCAD is not installed or not in PATH.\n\n"
-                "Please install OpenSCAD from:\n"
-                "https://openscad.org/downloads.html\n\n"
-                "After installation, add it to your PATH or install to:\n"
-                "C:\\Program Files\\OpenSCAD\\"
-            )
-        
-        if "failed to load board" in error_lower or "cannot open" in error_lower:
-            return (
-                "Failed to load the PCB file.\n\n"
-                "Possible causes:\n"
-                "• File is corrupted or not a valid KiCAD PCB file\n"
-                "• File is currently open in another application\n"
-                "• Insufficient permissions to read the file\n\n"
-                "Try saving the board and running the plugin again."
-            )
-        
-        if "modulenotfounderror" in error_lower or "importerror" in error_lower:
-            return (
-                "Python module import error.\n\n"
-                "This may indicate a KiCAD Python installation issue.\n"
-                "Try reinstalling or updating KiCAD to the latest version."
-            )
-        
-        # Return original error if we can't categorize it
-        # Don't truncate - full error will be shown in scrollable dialog
-        return "An error occurred during fixture generation.\n\nSee details below for the full error message."
+        # First rule whose keyword groups all matched wins
+        return next(
+            (message for groups, message in _ERROR_RULES
+             if all(any(keyword in error_lower for keyword in group) for group in groups)),
+            _ERR_GENERIC
+        )
     
     def _generate_fixture(self, params: dict, parent):
         """Execute fixture generation with comprehensive error handling"""
+        # subprocess is only needed once the user clicks Generate - keep it off plugin load
+        import subprocess
+        
         # Check OpenSCAD installation first
         openscad_ok, openscad_msg = self._check_openscad()
         if not openscad_ok:
@@ -895,22 +1161,11 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         # Find GenFixture.py - check multiple locations
         plugin_dir = Path(__file__).parent
         
-        # Search priority:
-        # 1. Same directory as plugin
-        # 2. openfixture_support subdirectory (for organized installations)
-        # 3. Parent directory (for development)
-        search_paths = [
-            plugin_dir / "GenFixture.py",
-            plugin_dir / "openfixture_support" / "GenFixture.py",
-            plugin_dir.parent / "GenFixture.py"
-        ]
-        
-        genfixture_path = None
-        for path in search_paths:
-            if path.exists():
-                genfixture_path = path
-                logger.info(f"Found GenFixture.py at: {path}")
-                break
+        genfixture_path = _discover_genfixture(plugin_dir)
+        if genfixture_path is None or not genfixture_path.is_file():
+            # Not found, or moved since the last run - search again
+            _discover_genfixture.cache_clear()
+            genfixture_path = _discover_genfixture(plugin_dir)
         
         if not genfixture_path:
             wx.MessageBox(
@@ -932,37 +1187,12 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
         # We need to find the actual Python interpreter
         python_exe = self._find_python_executable()
         
-        cmd = [
-            python_exe,
-            str(genfixture_path),
-            '--board', params['board'],
-            '--mat_th', params['mat_th'],
-            '--out', str(output_dir),
-            '--pcb_th', params['pcb_th'],
-            '--layer', params['layer'],
-            '--rev', params['rev'],
-            '--screw_len', params['screw_len'],
-            '--screw_d', params['screw_d'],
-            '--nut_th', params['nut_th'],
-            '--nut_f2f', params['nut_f2f'],
-            '--nut_c2c', params['nut_c2c'],
-            '--washer_th', params['washer_th'],
-            '--border', params['border'],
-            '--pogo-uncompressed-length', params['pogo_length'],
-            '--title', params['title'],
-        ]
-        
-        # Add verbose flag if enabled
-        if params.get('verbose', False):
-            cmd.append('--verbose')
+        cmd = [python_exe, genfixture_path, '--out', output_dir]
+        for flag, key in _GENFIXTURE_ARGS:
+            cmd += (flag, params[key])
+        cmd += [flag for flag, key, default in _GENFIXTURE_FLAGS if params.get(key, default)]
         
-        # Add pad type flags
-        if params.get('include_smd', True):
-            cmd.append('--include-smd')
-        if params.get('include_pth', True):
-            cmd.append('--include-pth')
-        
-        # Show progress dialog
+        # Show progress dialog (pulsed by a timer while the generator runs)
         progress = wx.ProgressDialog(
             "Generating Fixture",
             "Running GenFixture...\nThis may take a few minutes.",
@@ -971,109 +1201,171 @@ class OpenFixturePlugin(pcbnew.ActionPlugin):
             style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE
         )
         progress.Pulse()
-        
-        try:
-            # Run command
-            logger.info(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(board_dir)
-            )
-            
+        pulse_timer = wx.Timer(progress)
+        progress.Bind(wx.EVT_TIMER, lambda evt: progress.Pulse(), pulse_timer)
+        pulse_timer.Start(100)
+        
+        def show_status(message):
+            """Runs on the UI thread for each GenFixture progress message"""
+            if progress:
+                progress.Pulse(f"Running GenFixture...\n{message}")
+        
+        def finish(result=None, error=None, error_details=None):
+            """Runs on the UI thread once the generator has exited"""
+            pulse_timer.Stop()
             progress.Update(100)
             progress.Destroy()
             
-            if result.returncode == 0:
-                # Verify output files were actually created
-                board_name = Path(params['board']).stem
-                all_ok, found_files, missing_files = self._verify_output_files(
-                    output_dir, board_name, params['layer']
-                )
-                
-                if all_ok:
-                    # Success - all required files generated
-                    file_list = "\n".join([f"  ✅ {f}" for f in found_files])
-                    
-                    # Check if log file was created (verbose mode)
-                    log_msg = ""
-                    if params.get('verbose', False):
-                        # Find the log file in output directory
-                        import glob
-                        log_files = glob.glob(str(output_dir / "openfixture_*.log"))
-                        if log_files:
-                            log_file = Path(log_files[-1]).name  # Get most recent
-                            log_msg = f"\n\nVerbose log: {log_file}"
-                    
-                    wx.MessageBox(
-                        f"Fixture generated successfully!\n\n"
-                        f"Output directory: {output_dir}\n\n"
-                        f"Files generated:\n{file_list}{log_msg}\n\n"
-                        f"Opening output directory...",
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
-                    
-                    # Open output directory
-                    try:
-                        if sys.platform == 'win32':
-                            os.startfile(str(output_dir))
-                        elif sys.platform == 'darwin':
-                            subprocess.run(['open', str(output_dir)])
-                        else:
-                            subprocess.run(['xdg-open', str(output_dir)])
-                    except Exception as e:
-                        logger.warning(f"Could not open output directory: {e}")
-                else:
-                    # Some files missing - partial success
-                    found_list = "\n".join([f"  ✅ {f}" for f in found_files])
-                    missing_list = "\n".join([f"  ❌ {f}" for f in missing_files])
-                    wx.MessageBox(
-                        f"Generation completed with warnings!\n\n"
-                        f"Some expected files were not created:\n\n"
-                        f"Found:\n{found_list}\n\n"
-                        f"Missing:\n{missing_list}\n\n"
-                        f"Check the logs for more details.",
-                        "Partial Success",
-                        wx.OK | wx.ICON_WARNING
+            if error is None:
+                try:
+                    self._handle_generation_result(result, params, output_dir, parent)
+                    return
+                except Exception as e:
+                    error, error_details = e, traceback.format_exc()
+            
+            self._show_execution_error(parent, error, error_details)
+        
+        def worker():
+            """Runs GenFixture off the UI thread so KiCAD stays responsive"""
+            try:
+                # Drain both pipes while GenFixture runs, keeping only the tail
+                # of each (full --verbose output goes to the log file anyway)
+                stdout_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+                stderr_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+                with subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=-1,
+                    cwd=board_dir
+                ) as proc:
+                    stdout_reader = threading.Thread(
+                        target=stdout_tail.extend, args=(proc.stdout,), daemon=True
                     )
+                    stdout_reader.start()
                     
-            else:
-                # Error - parse and display user-friendly message
-                error_text = result.stderr if result.stderr else result.stdout
-                user_friendly_error = self._parse_error_message(error_text)
+                    # GenFixture logs its steps to stderr - mirror the latest
+                    # INFO message in the progress dialog (at most every 100 ms)
+                    last_status = 0.0
+                    for line in proc.stderr:
+                        stderr_tail.append(line)
+                        _, sep, message = line.rpartition(" - INFO - ")
+                        now = time.monotonic()
+                        if sep and now - last_status >= 0.1:
+                            last_status = now
+                            wx.CallAfter(show_status, message.strip())
+                    stdout_reader.join()
+                    returncode = proc.wait()
                 
-                # Use scrollable error dialog for better error display
-                error_dialog = ErrorDialog(
-                    parent,
-                    "Generation Failed",
-                    user_friendly_error,
-                    details=error_text
+                result = subprocess.CompletedProcess(
+                    cmd, returncode, "".join(stdout_tail), "".join(stderr_tail)
                 )
-                error_dialog.ShowModal()
-                error_dialog.Destroy()
-                
-                logger.error(f"Generation failed (exit code {result.returncode}): {error_text}")
+            except Exception as e:
+                wx.CallAfter(finish, error=e, error_details=traceback.format_exc())
+            else:
+                wx.CallAfter(finish, result)
         
-        except Exception as e:
-            progress.Destroy()
+        logger.info(f"Running: {' '.join(map(os.fspath, cmd))}")
+        threading.Thread(target=worker, name="GenFixture", daemon=True).start()
+    
+    def _handle_generation_result(self, result, params: dict, output_dir: Path, parent):
+        """Report the outcome of a finished GenFixture run to the user"""
+        import subprocess
+        
+        if result.returncode == 0:
+            # Verify output files were actually created
+            board_name = Path(params['board']).stem
+            all_ok, found_files, missing_files = self._verify_output_files(
+                output_dir, board_name, params['layer']
+            )
             
-            # Get traceback for detailed error
-            import traceback
-            error_details = traceback.format_exc()
+            if all_ok:
+                # Success - all required files generated
+                file_list = "\n".join(map("  ✅ {}".format, found_files))
+                
+                # Check if log file was created (verbose mode)
+                log_msg = ""
+                if params.get('verbose', False):
+                    # Find the most recent log file in output directory
+                    with os.scandir(output_dir) as it:
+                        latest = max(
+                            (e for e in it
+                             if e.name.startswith("openfixture_") and e.name.endswith(".log")),
+                            key=lambda e: e.stat().st_mtime,
+                            default=None
+                        )
+                    if latest:
+                        log_msg = f"\n\nVerbose log: {latest.name}"
+                
+                wx.MessageBox(
+                    f"Fixture generated successfully!\n\n"
+                    f"Output directory: {output_dir}\n\n"
+                    f"Files generated:\n{file_list}{log_msg}\n\n"
+                    f"Opening output directory...",
+                    "Success",
+                    wx.OK | wx.ICON_INFORMATION
+                )
+                
+                # Open output directory
+                try:
+                    # Fire and forget - don't wait for the file manager on the UI thread
+                    if sys.platform == 'win32':
+                        os.startfile(output_dir)
+                    else:
+                        opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                        subprocess.Popen(
+                            [opener, output_dir],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            start_new_session=True
+                        )
+                except Exception as e:
+                    logger.warning(f"Could not open output directory: {e}")
+            else:
+                # Some files missing - partial success
+                found_list = "\n".join(map("  ✅ {}".format, found_files))
+                missing_list = "\n".join(map("  ❌ {}".format, missing_files))
+                wx.MessageBox(
+                    f"Generation completed with warnings!\n\n"
+                    f"Some expected files were not created:\n\n"
+                    f"Found:\n{found_list}\n\n"
+                    f"Missing:\n{missing_list}\n\n"
+                    f"Check the logs for more details.",
+                    "Partial Success",
+                    wx.OK | wx.ICON_WARNING
+                )
+                
+        else:
+            # Error - parse and display user-friendly message
+            error_text = result.stderr if result.stderr else result.stdout
+            user_friendly_error = self._parse_error_message(error_text)
             
-            # Use scrollable error dialog
+            # Use scrollable error dialog for better error display
             error_dialog = ErrorDialog(
                 parent,
-                "Execution Error",
-                f"Error running generator:\n{str(e)}",
-                details=error_details
+                "Generation Failed",
+                user_friendly_error,
+                details=error_text
             )
             error_dialog.ShowModal()
             error_dialog.Destroy()
             
-            logger.error(f"Execution error: {e}", exc_info=True)
+            logger.error(f"Generation failed (exit code {result.returncode}): {error_text}")
+    
+    def _show_execution_error(self, parent, error: Exception, error_details: str):
+        """Show an unexpected exception from the generation run"""
+        # Use scrollable error dialog
+        error_dialog = ErrorDialog(
+            parent,
+            "Execution Error",
+            f"Error running generator:\n{str(error)}",
+            details=error_details
+        )
+        error_dialog.ShowModal()
+        error_dialog.Destroy()
+        
+        logger.error(f"Execution error: {error}\n{error_details}")
 
 
 # Register plugin
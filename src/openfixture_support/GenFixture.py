@@ -25,14 +25,20 @@ __author__ = "Elliot Buller, Community Contributors"
 __license__ = "CC-BY-SA-4.0"
 
 import os
+import re
 import sys
 import argparse
 import logging
-import subprocess
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
-import pcbnew
+from typing import TYPE_CHECKING, List, Tuple, Optional, Dict
+
+# pcbnew (multi-MB SWIG extension), subprocess and shutil are imported lazily
+# where used so --help and argument errors do not pay for loading them
+if TYPE_CHECKING:
+    import pcbnew
 
 # Setup logging
 logging.basicConfig(
@@ -46,6 +52,134 @@ DEFAULT_PCB_TH = 1.6
 DEFAULT_SCREW_D = 3.0
 DEFAULT_SCREW_LEN = 14
 
+# pcbnew internal units are nanometres (KiCAD 6+): divide by this instead of pcbnew.ToMM()
+IU_PER_MM = 1e6
+
+# Bare numeric literal (e.g. "3.00", "-1.5", "2e-3") - passed to OpenSCAD unquoted
+_NUM_RE = re.compile(r'^[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$')
+
+# Common OpenSCAD installation paths (probed when openscad is not in PATH)
+if os.name == 'nt':
+    _OPENSCAD_PATHS = (
+        r"C:\Program Files\OpenSCAD\openscad.exe",
+        r"C:\Program Files (x86)\OpenSCAD\openscad.exe",
+        os.path.expanduser(r"~\AppData\Local\Programs\OpenSCAD\openscad.exe"),
+    )
+else:
+    _OPENSCAD_PATHS = (
+        "/usr/bin/openscad",
+        "/usr/local/bin/openscad",
+        "/opt/openscad/bin/openscad",
+    )
+
+# PCB_PLOT_PARAMS setters that differ between KiCAD 8 and 9 (see plot_dxf)
+_POPT_METHODS = (
+    "SetDXFPlotUnits",
+    "GetDXFPlotUnits",
+    "SetDXFPlotPolygonMode",
+    "SetPlotFrameRef",
+    "SetLineWidth",
+    "SetAutoScale",
+    "SetScale",
+    "SetMirror",
+    "SetUseGerberAttributes",
+    "SetExcludeEdgeLayer",
+    "SetSubtractMaskFromSilk",
+    "SetUseAuxOrigin",
+    "SetDrillMarksType",
+    "SetColor",
+)
+_plot_caps: Optional[Dict[str, bool]] = None
+
+# openfixture.scad ships in the same directory as this script
+SCAD_FILE = Path(__file__).parent / "openfixture.scad"
+
+
+def _round_mm(x: float) -> float:
+    """Round a mm value to the 0.01 mm grid (same result as the former round_value)"""
+    return round(0.01 * round(x / 0.01), 2)
+
+
+@lru_cache(maxsize=1)
+def _find_openscad() -> Optional[str]:
+    """Find OpenSCAD executable (probed once per process)"""
+    import shutil
+    
+    # Try to find in PATH
+    openscad = shutil.which('openscad')
+    if openscad:
+        return openscad
+    
+    # Common installation paths for this platform
+    for path in _OPENSCAD_PATHS:
+        if os.path.exists(path):
+            return path
+    
+    return None
+
+
+def _probe_plot_caps(popt) -> Dict[str, bool]:
+    """
+    Detect which plot option setters the running KiCAD exposes
+    
+    Probed on the first plot and reused, so plot_dxf branches on booleans
+    instead of raising and catching AttributeError for every removed method.
+    """
+    global _plot_caps
+    if _plot_caps is None:
+        _plot_caps = {name: hasattr(popt, name) for name in _POPT_METHODS}
+    return _plot_caps
+
+
+def _format_openscad_value(value) -> str:
+    """Format a parameter value for an OpenSCAD -D definition"""
+    if isinstance(value, str):
+        # Check if it's an array literal (starts with '[')
+        if value.strip().startswith('['):
+            # Array - no quotes
+            return value
+        if _NUM_RE.match(value):
+            # Numeric string (e.g., "3.00", "12.31") - no quotes (OpenSCAD needs bare numbers)
+            return value
+        # Non-numeric string - escape and add quotes
+        # Escape backslashes first, then quotes (order matters!)
+        escaped_value = value.replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped_value}"'
+    # Numeric value - no quotes
+    return str(value)
+
+
+@lru_cache(maxsize=16)
+def _load_toml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a TOML file, cached per (path, mtime_ns, size)
+    
+    Batch runs sharing one config file parse it once; editing the file changes
+    its nanosecond mtime or size and forces a re-parse. The returned dict is shared between callers
+    and must not be modified.
+    
+    Backends are tried fastest first: rtoml (Rust, optional), then tomllib
+    (Python 3.11+), then tomli.
+    
+    Raises:
+        ImportError: If none of rtoml, tomllib or tomli is available
+    """
+    try:
+        import rtoml
+    except ImportError:
+        pass
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            return dict(rtoml.load(f))
+    
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+    
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
 
 class FixtureConfig:
     """Configuration container for fixture parameters"""
@@ -82,23 +216,23 @@ class FixtureConfig:
         self.logo_offset_x = None
         self.logo_offset_y = None
         self.logo_offset_z = None
+    
+    @property
+    def logo_enable_str(self) -> str:
+        """OpenSCAD flag for logo_enable ("1"/"0")"""
+        return "1" if self.logo_enable else "0"
         
     @classmethod
     def from_toml(cls, toml_path: str) -> 'FixtureConfig':
         """Load configuration from TOML file"""
-        try:
-            import tomllib
-        except ImportError:
+        config = cls()
+        if Path(toml_path).exists():
             try:
-                import tomli as tomllib
+                st = os.stat(toml_path)
+                data = _load_toml_cached(os.path.abspath(toml_path), st.st_mtime_ns, st.st_size)
             except ImportError:
                 logger.warning("TOML support not available (Python <3.11 and tomli not installed)")
-                return cls()
-        
-        config = cls()
-        if Path(toml_path).exists():
-            with open(toml_path, 'rb') as f:
-                data = tomllib.load(f)
+                return config
             
             # Board parameters
             board_cfg = data.get('board', {})
@@ -156,7 +290,9 @@ class GenFixture:
     for laser-cuttable test fixture generation.
     """
     
-    def __init__(self, prj_name: str, brd: pcbnew.BOARD, config: FixtureConfig):
+    def __init__(self, prj_name: str, brd: 'pcbnew.BOARD', config: FixtureConfig):
+        import pcbnew
+        
         self.prj_name = prj_name
         self.brd = brd
         self.config = config
@@ -186,11 +322,19 @@ class GenFixture:
         # Track if auxiliary origin was successfully set (KiCAD 9 compatibility)
         self.origin_forced: bool = False
         
+        # Shared DXF plot controller (configured once per generate() by _setup_plotter)
+        self._pctl = None
+        self._popt = None
+        self._aux_origin_save = None
+        self._has_aux_origin = False
+        
         # Actual board dimensions from Edge.Cuts (for validation)
         self.board_width_mm = 0.0
         self.board_height_mm = 0.0
         
     def __str__(self) -> str:
+        import pcbnew
+        
         layer_info = "both sides" if self.both_sides else ("F.Cu" if self.layer == pcbnew.F_Cu else "B.Cu")
         if self.both_sides:
             tp_info = f"top={len(self.test_points_top)} bottom={len(self.test_points_bottom)} total={len(self.test_points)}"
@@ -212,6 +356,8 @@ class GenFixture:
             flayer: Force layer (Eco2.User)
             both: If True, extract test points from both F.Cu and B.Cu
         """
+        import pcbnew
+        
         self.both_sides = both
         
         if layer != -1 and not both:
@@ -230,10 +376,6 @@ class GenFixture:
                 self.paste = pcbnew.B_Paste
                 self.mirror = True
     
-    def round_value(self, x: float, base: float = 0.01) -> float:
-        """Round value to specified precision"""
-        return round(base * round(x / base), 2)
-    
     def force_origin_to_zero(self) -> bool:
         """
         Note: This function is kept for API compatibility but does nothing.
@@ -247,38 +389,39 @@ class GenFixture:
         self.origin_forced = False
         return False
     
-    def plot_dxf(self, path: str, layer_to_check: str):
+    def _setup_plotter(self, path: str):
         """
-        Export DXF file for specified layer with forced (0,0) origin
+        Create and configure the DXF plot controller once for all plot_dxf() calls
         
         Args:
             path: Output directory
-            layer_to_check: "outline" for Edge.Cuts, "track" for copper layer
         """
+        import pcbnew
+        
         # Save auxiliary origin for restoration (KiCAD 8 compatibility)
-        aux_origin_save = None
-        has_aux_origin = hasattr(self.brd, 'GetAuxOrigin')
+        self._aux_origin_save = None
+        self._has_aux_origin = hasattr(self.brd, 'GetAuxOrigin')
         
-        if has_aux_origin:
+        if self._has_aux_origin:
             try:
-                aux_origin_save = self.brd.GetAuxOrigin()
+                self._aux_origin_save = self.brd.GetAuxOrigin()
             except AttributeError:
                 logger.warning("GetAuxOrigin not available, continuing without it")
-                has_aux_origin = False
+                self._has_aux_origin = False
         
-        # Force origin to (0,0) for this export
+        # Force origin to (0,0) for the exports
         # Set new aux origin to upper left side of board (KiCAD 8 only)
-        if has_aux_origin:
+        if self._has_aux_origin:
             try:
                 origin_point = pcbnew.VECTOR2I(
-                    pcbnew.FromMM(self.origin[0]),
-                    pcbnew.FromMM(self.origin[1])
+                    int(round(self.origin[0] * IU_PER_MM)),
+                    int(round(self.origin[1] * IU_PER_MM))
                 )
                 self.brd.SetAuxOrigin(origin_point)
                 logger.debug(f"Set export origin to board top-left: ({self.origin[0]:.2f}, {self.origin[1]:.2f}) mm")
             except AttributeError:
                 logger.warning("SetAuxOrigin not available, using plot origin instead")
-                has_aux_origin = False
+                self._has_aux_origin = False
         
         # Get pointers to controllers
         pctl = pcbnew.PLOT_CONTROLLER(self.brd)
@@ -287,101 +430,119 @@ class GenFixture:
         # Setup output directory
         popt.SetOutputDirectory(path)
         
+        # Which PCB_PLOT_PARAMS setters this KiCAD version exposes (probed once per process)
+        caps = _probe_plot_caps(popt)
+        
         # Set DXF plot units to millimeters
         # DXF format supports only 2 units: 0=inches, 1=millimeters
         # KiCAD 9.0 uses integer values (named constants not exposed in Python bindings)
-        try:
-            popt.SetDXFPlotUnits(1)  # 1 = millimeters, 0 = inches
-            logger.debug("✓ DXF units set to millimeters (1=mm, 0=inches)")
-            
-            # Verify what was set (if getter available)
-            if hasattr(popt, 'GetDXFPlotUnits'):
-                try:
-                    current_units = popt.GetDXFPlotUnits()
-                    unit_name = "millimeters" if current_units == 1 else ("inches" if current_units == 0 else f"unknown({current_units})")
-                    logger.debug(f"Verified DXF units: {current_units} ({unit_name})")
-                except Exception as e:
-                    logger.debug(f"Could not verify DXF units: {e}")
-        except AttributeError:
+        if caps['SetDXFPlotUnits']:
+            try:
+                popt.SetDXFPlotUnits(1)  # 1 = millimeters, 0 = inches
+                logger.debug("✓ DXF units set to millimeters (1=mm, 0=inches)")
+                
+                # Verify what was set (if getter available)
+                if caps['GetDXFPlotUnits'] and logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        current_units = popt.GetDXFPlotUnits()
+                        unit_name = "millimeters" if current_units == 1 else ("inches" if current_units == 0 else f"unknown({current_units})")
+                        logger.debug(f"Verified DXF units: {current_units} ({unit_name})")
+                    except Exception as e:
+                        logger.debug(f"Could not verify DXF units: {e}")
+            except Exception as e:
+                logger.warning(f"Could not set DXF units: {type(e).__name__}: {e}. Using KiCAD default.")
+        else:
             logger.warning("SetDXFPlotUnits method not available - using KiCAD default (likely millimeters)")
-        except Exception as e:
-            logger.warning(f"Could not set DXF units: {type(e).__name__}: {e}. Using KiCAD default.")
         
         # SetDXFPlotPolygonMode - CRITICAL for outline cutouts
         # TRUE = export filled polygons (required for OpenSCAD import)
         # FALSE = export only line segments (won't create filled cutouts)
-        try:
+        if caps['SetDXFPlotPolygonMode']:
             popt.SetDXFPlotPolygonMode(True)
             logger.debug("DXF polygon mode enabled (filled shapes)")
-        except AttributeError:
+        else:
             logger.warning("SetDXFPlotPolygonMode not available - outline may export as lines only")
-            pass
         
         # SetPlotFrameRef (may be removed in KiCAD 9)
-        try:
+        if caps['SetPlotFrameRef']:
             popt.SetPlotFrameRef(False)
-        except AttributeError:
-            pass
         
         # SetLineWidth (KiCAD 8 only, removed in KiCAD 9)
-        try:
-            popt.SetLineWidth(pcbnew.FromMM(0.1))
-        except AttributeError:
-            pass
+        if caps['SetLineWidth']:
+            popt.SetLineWidth(int(0.1 * IU_PER_MM))
         
         # SetAutoScale/SetScale - CRITICAL for dimensional accuracy
         # Must explicitly set SetScale(1.0) to prevent dimensional errors
-        try:
+        if caps['SetAutoScale'] and caps['SetScale']:
             popt.SetAutoScale(False)
             popt.SetScale(1.0)  # CRITICAL: 1.0 = no scaling, exact dimensions
             logger.debug("✓ Scale set to 1.0 (no scaling) for accurate dimensions")
-        except AttributeError:
+        else:
             logger.debug("SetAutoScale/SetScale not available (KiCAD 9 may handle automatically)")
-            pass
         
         # SetMirror (may be removed in KiCAD 9)
-        try:
+        if caps['SetMirror']:
             popt.SetMirror(self.mirror)
-        except AttributeError:
-            pass
         
         # SetUseGerberAttributes (may be removed in KiCAD 9)
-        try:
+        if caps['SetUseGerberAttributes']:
             popt.SetUseGerberAttributes(False)
-        except AttributeError:
-            pass
         
         # SetExcludeEdgeLayer (KiCAD 8 only, removed in KiCAD 9)
-        try:
+        if caps['SetExcludeEdgeLayer']:
             popt.SetExcludeEdgeLayer(False)
-        except AttributeError:
-            pass  # KiCAD 9 doesn't have SetExcludeEdgeLayer
         
         # SetSubtractMaskFromSilk (KiCAD 8 only, may be removed in KiCAD 9)
-        try:
+        if caps['SetSubtractMaskFromSilk']:
             popt.SetSubtractMaskFromSilk(False)
-        except AttributeError:
-            pass  # KiCAD 9 doesn't have SetSubtractMaskFromSilk
         
         # Use auxiliary origin if available, otherwise use drill/place origin
-        if has_aux_origin:
-            try:
+        if self._has_aux_origin:
+            if caps['SetUseAuxOrigin']:
                 popt.SetUseAuxOrigin(True)
-            except AttributeError:
-                pass  # KiCAD 9 may not have SetUseAuxOrigin
-        else:
+        elif caps['SetDrillMarksType']:
             # KiCAD 9: Use drill/place file origin
             # This provides similar functionality to auxiliary origin
             try:
                 popt.SetDrillMarksType(pcbnew.DRILL_MARKS_NO_DRILL_SHAPE)
-            except:
+            except Exception:
                 pass
         
         # SetColor (KiCAD 8 only, removed in KiCAD 9)
-        try:
+        if caps['SetColor']:
             popt.SetColor(pcbnew.COLOR4D(0, 0, 0, 1.0))
-        except AttributeError:
-            pass  # KiCAD 9 doesn't have SetColor
+        
+        self._pctl = pctl
+        self._popt = popt
+    
+    def _close_plotter(self):
+        """Release the shared plot controller and restore the auxiliary origin"""
+        # Restore origin (KiCAD 8 only)
+        if self._has_aux_origin and self._aux_origin_save is not None:
+            try:
+                self.brd.SetAuxOrigin(self._aux_origin_save)
+            except AttributeError:
+                pass
+        
+        self._pctl = None
+        self._popt = None
+        self._aux_origin_save = None
+    
+    def plot_dxf(self, path: str, layer_to_check: str):
+        """
+        Export DXF file for specified layer with forced (0,0) origin
+        
+        Args:
+            path: Output directory
+            layer_to_check: "outline" for Edge.Cuts, "track" for copper layer
+        """
+        import pcbnew
+        
+        # Reuse the plotter configured by generate(); standalone calls set up their own
+        owns_plotter = self._pctl is None
+        if owns_plotter:
+            self._setup_plotter(path)
+        pctl = self._pctl
         
         # Open file and plot layer(s)
         if layer_to_check == "outline":
@@ -416,12 +577,8 @@ class GenFixture:
                 pctl.PlotLayer()
                 pctl.ClosePlot()
         
-        # Restore origin (KiCAD 8 only)
-        if has_aux_origin and aux_origin_save is not None:
-            try:
-                self.brd.SetAuxOrigin(aux_origin_save)
-            except AttributeError:
-                pass
+        if owns_plotter:
+            self._close_plotter()
         
         logger.info(f"Exported DXF: {layer_to_check}")
         
@@ -449,6 +606,8 @@ class GenFixture:
         opposite side of the board. Use checkboxes to control which pad types
         are included as test points.
         """
+        import pcbnew
+        
         logger.info("Extracting test points...")
         logger.info(f"  Include SMD pads: {self.config.include_smd}")
         logger.info(f"  Include PTH pads: {self.config.include_pth}")
@@ -468,71 +627,97 @@ class GenFixture:
         else:
             layers_to_process = [(self.layer, self.paste, self.mirror)]
         
+        # Read footprint side and pad list once (reused for both layers in both-sides mode).
+        # Footprints cannot be skipped by side alone: PTH pins of opposite-side
+        # components and card-edge pads are on the test layer by design.
+        # Modern API: GetFootprints instead of GetModules
+        footprints = [(footprint.GetLayer(), list(footprint.Pads()))
+                      for footprint in self.brd.GetFootprints()]
+        
+        # Bind loop invariants as locals (avoids attribute lookups per pad)
+        force_layer = self.force_layer
+        ignore_layer = self.ignore_layer
+        include_smd = self.config.include_smd
+        include_pth = self.config.include_pth
+        PAD_ATTRIB_SMD = pcbnew.PAD_ATTRIB_SMD
+        PAD_ATTRIB_PTH = pcbnew.PAD_ATTRIB_PTH
+        
+        # Per-pad log lines call GetNetname() through SWIG - only do it when they will be emitted
+        log_info = logger.isEnabledFor(logging.INFO)
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        
         # Process each layer
         for process_layer, process_paste, process_mirror in layers_to_process:
             layer_name = "F.Cu" if process_layer == pcbnew.F_Cu else "B.Cu"
             logger.info(f"  Scanning layer: {layer_name}")
             
-            # Iterate over all footprints (modern API: GetFootprints instead of GetModules)
-            for footprint in self.brd.GetFootprints():
-                # Get the layer where the component is placed (F.Cu or B.Cu)
-                component_layer = footprint.GetLayer()
-                
+            # Pass 1: filter pads and collect raw positions (internal units)
+            raw_points = []
+            append_point = raw_points.append
+            
+            # Iterate over all footprints
+            # component_layer: the layer where the component is placed (F.Cu or B.Cu)
+            for component_layer, pads in footprints:
                 # Iterate over all pads
-                for pad in footprint.Pads():
+                for pad in pads:
                     # Check if pad is on current processing layer
                     if not pad.IsOnLayer(process_layer):
                         continue
                     
                     # Check if forcing this pad
-                    if pad.IsOnLayer(self.force_layer):
+                    if pad.IsOnLayer(force_layer):
                         pass  # Include regardless
                     # Check ignore conditions
-                    elif pad.IsOnLayer(self.ignore_layer):
+                    elif pad.IsOnLayer(ignore_layer):
                         continue  # Explicitly ignored
                     elif pad.IsOnLayer(process_paste):
                         continue  # Has paste mask
                     # Check pad type based on config flags
                     else:
                         pad_attr = pad.GetAttribute()
-                        if pad_attr == pcbnew.PAD_ATTRIB_SMD and not self.config.include_smd:
+                        if pad_attr == PAD_ATTRIB_SMD and not include_smd:
                             continue  # SMD not included
-                        elif pad_attr == pcbnew.PAD_ATTRIB_PTH and not self.config.include_pth:
+                        elif pad_attr == PAD_ATTRIB_PTH and not include_pth:
                             continue  # PTH not included
-                        elif pad_attr == pcbnew.PAD_ATTRIB_PTH and self.config.include_pth:
+                        elif pad_attr == PAD_ATTRIB_PTH and include_pth:
                             # Only use PTH pads from components on the OPPOSITE side
                             # If testing from top (F.Cu), only use PTH from bottom components (B.Cu)
                             # If testing from bottom (B.Cu), only use PTH from top components (F.Cu)
                             if component_layer == process_layer:
-                                logger.debug(f"  Skipping PTH pad {pad.GetNetname()} - component on same side as test layer")
+                                if log_debug:
+                                    logger.debug(f"  Skipping PTH pad {pad.GetNetname()} - component on same side as test layer")
                                 continue  # Component on same side - pins blocked by component body
-                        elif (pad_attr != pcbnew.PAD_ATTRIB_SMD and 
-                              pad_attr != pcbnew.PAD_ATTRIB_PTH):
+                        elif (pad_attr != PAD_ATTRIB_SMD and 
+                              pad_attr != PAD_ATTRIB_PTH):
                             continue  # Only SMD and PTH are valid
                     
                     # Get position (modern API returns VECTOR2I)
                     pos = pad.GetPosition()
-                    tp_x = pcbnew.ToMM(pos.x)
-                    tp_y = pcbnew.ToMM(pos.y)
-                    
-                    # Always use absolute KiCAD drill origin coordinates (no offset needed)
-                    x = self.round_value(tp_x)
-                    y = self.round_value(tp_y)
-                    
+                    append_point((pos.x, pos.y, pad))
+            
+            # Pass 2: convert the whole batch to mm
+            # Always use absolute KiCAD drill origin coordinates (no offset needed)
+            points = [(_round_mm(x / IU_PER_MM), _round_mm(y / IU_PER_MM))
+                      for x, y, _ in raw_points]
+            
+            if log_info:
+                for (x, y), (_, _, pad) in zip(points, raw_points):
                     logger.info(f"  tp[{pad.GetNetname()}]@{layer_name} = ({x:.2f}, {y:.2f})")
-                    
-                    # Track minimum y coordinate
-                    if y < self.min_y:
-                        self.min_y = y
-                    
-                    # Save coordinates
-                    self.test_points.append((x, y))
-                    
-                    # Also save to layer-specific list (used by OpenSCAD)
-                    if process_layer == pcbnew.F_Cu:
-                        self.test_points_top.append((x, y))
-                    else:
-                        self.test_points_bottom.append((x, y))
+            
+            if not points:
+                continue
+            
+            # Track minimum y coordinate
+            self.min_y = min(self.min_y, min(y for _, y in points))
+            
+            # Save coordinates
+            self.test_points.extend(points)
+            
+            # Also save to layer-specific list (used by OpenSCAD)
+            if process_layer == pcbnew.F_Cu:
+                self.test_points_top.extend(points)
+            else:
+                self.test_points_bottom.extend(points)
         
         if self.both_sides:
             logger.info(f"Found {len(self.test_points_top)} test points on F.Cu (top)")
@@ -551,58 +736,30 @@ class GenFixture:
         if self.brd is None:
             return
         
-        edge_max_x = 0
-        edge_max_y = 0
+        # Edge.Cuts extents (board outline) - PRIMARY source for origin/dimensions
+        edge_bbox = self._edge_cuts_bbox()
+        
+        # Footprint extents for reference only (to detect overhang)
         comp_max_x = 0
         comp_max_y = 0
-        edge_cuts_found = False
-        
-        # Get all drawings (board outline) - PRIMARY source for origin/dimensions
-        for drawing in self.brd.GetDrawings():
-            if drawing.GetLayerName() == 'Edge.Cuts':
-                edge_cuts_found = True
-                bb = drawing.GetBoundingBox()
-                
-                x = pcbnew.ToMM(bb.GetX())
-                y = pcbnew.ToMM(bb.GetY())
-                w = pcbnew.ToMM(bb.GetWidth())
-                h = pcbnew.ToMM(bb.GetHeight())
-                
-                # Track minimum (origin) from Edge.Cuts only
-                if x < self.origin[0]:
-                    self.origin[0] = self.round_value(x)
-                if y < self.origin[1]:
-                    self.origin[1] = self.round_value(y)
-                
-                # Track maximum from Edge.Cuts
-                if x + w > edge_max_x:
-                    edge_max_x = x + w
-                if y + h > edge_max_y:
-                    edge_max_y = y + h
-        
-        # Get all footprints for reference only (to detect overhang)
         for footprint in self.brd.GetFootprints():
             bb = footprint.GetBoundingBox()
-            
-            x = pcbnew.ToMM(bb.GetX())
-            y = pcbnew.ToMM(bb.GetY())
-            w = pcbnew.ToMM(bb.GetWidth())
-            h = pcbnew.ToMM(bb.GetHeight())
-            
-            # Track component extents (for warning only)
-            if x + w > comp_max_x:
-                comp_max_x = x + w
-            if y + h > comp_max_y:
-                comp_max_y = y + h
+            comp_max_x = max(comp_max_x, (bb.GetX() + bb.GetWidth()) / IU_PER_MM)
+            comp_max_y = max(comp_max_y, (bb.GetY() + bb.GetHeight()) / IU_PER_MM)
         
         # Use Edge.Cuts dimensions if available, fallback to components
-        if edge_cuts_found and edge_max_x > 0 and edge_max_y > 0:
-            self.dims[0] = self.round_value(edge_max_x - self.origin[0])
-            self.dims[1] = self.round_value(edge_max_y - self.origin[1])
+        if edge_bbox is not None:
+            min_x, min_y, edge_max_x, edge_max_y = edge_bbox
+            self.origin[0] = min(self.origin[0], _round_mm(min_x))
+            self.origin[1] = min(self.origin[1], _round_mm(min_y))
+        
+        if edge_bbox is not None and edge_max_x > 0 and edge_max_y > 0:
+            self.dims[0] = _round_mm(edge_max_x - self.origin[0])
+            self.dims[1] = _round_mm(edge_max_y - self.origin[1])
             
             # Check for component overhang
-            comp_width = self.round_value(comp_max_x - self.origin[0])
-            comp_height = self.round_value(comp_max_y - self.origin[1])
+            comp_width = _round_mm(comp_max_x - self.origin[0])
+            comp_height = _round_mm(comp_max_y - self.origin[1])
             
             overhang_x = comp_width - self.dims[0]
             overhang_y = comp_height - self.dims[1]
@@ -613,55 +770,51 @@ class GenFixture:
         else:
             # Fallback: use component bounding boxes
             logger.warning("No Edge.Cuts layer found - using component bounding boxes for dimensions")
-            self.dims[0] = self.round_value(comp_max_x - self.origin[0])
-            self.dims[1] = self.round_value(comp_max_y - self.origin[1])
+            self.dims[0] = _round_mm(comp_max_x - self.origin[0])
+            self.dims[1] = _round_mm(comp_max_y - self.origin[1])
         
-        # Get actual board dimensions from Edge.Cuts for validation
-        self.get_board_dimensions_from_edge_cuts()
+        # Get actual board dimensions from Edge.Cuts for validation (reuses the scan above)
+        self.get_board_dimensions_from_edge_cuts(edge_bbox)
         
         logger.info(f"Board dimensions: {self.dims[0]:.2f} x {self.dims[1]:.2f} mm")
         logger.info(f"Board origin: ({self.origin[0]:.2f}, {self.origin[1]:.2f})")
         if self.board_width_mm > 0 and self.board_height_mm > 0:
             logger.info(f"Edge.Cuts dimensions: {self.board_width_mm:.2f} x {self.board_height_mm:.2f} mm")
     
-    def get_board_dimensions_from_edge_cuts(self):
+    def _edge_cuts_bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Return the combined extents of the Edge.Cuts outline
+        
+        Returns:
+            (min_x, min_y, max_x, max_y) in mm, or None if no Edge.Cuts drawing exists
+        """
+        # KiCAD computes the Edge.Cuts extents in C++ - one call instead of a drawing scan
+        bb = self.brd.GetBoardEdgesBoundingBox()
+        if bb.GetWidth() <= 0 and bb.GetHeight() <= 0:
+            return None
+        x = bb.GetX() / IU_PER_MM
+        y = bb.GetY() / IU_PER_MM
+        return x, y, x + bb.GetWidth() / IU_PER_MM, y + bb.GetHeight() / IU_PER_MM
+    
+    def get_board_dimensions_from_edge_cuts(self, edge_bbox: Optional[Tuple[float, float, float, float]] = None):
         """
         Get actual board dimensions from Edge.Cuts layer using KiCAD API.
         This provides the official PCB outline dimensions for validation.
+        
+        Args:
+            edge_bbox: Edge.Cuts extents already computed by _edge_cuts_bbox()
+                       (scanned from the board if omitted)
         """
         if self.brd is None:
             return
         
-        min_x = float("inf")
-        min_y = float("inf")
-        max_x = float("-inf")
-        max_y = float("-inf")
-        
-        # Get Edge.Cuts bounding box from all drawings
-        edge_cuts_found = False
-        for drawing in self.brd.GetDrawings():
-            if drawing.GetLayerName() == 'Edge.Cuts':
-                edge_cuts_found = True
-                bb = drawing.GetBoundingBox()
-                
-                x = pcbnew.ToMM(bb.GetX())
-                y = pcbnew.ToMM(bb.GetY())
-                w = pcbnew.ToMM(bb.GetWidth())
-                h = pcbnew.ToMM(bb.GetHeight())
-                
-                # Track bounding box
-                if x < min_x:
-                    min_x = x
-                if y < min_y:
-                    min_y = y
-                if x + w > max_x:
-                    max_x = x + w
-                if y + h > max_y:
-                    max_y = y + h
-        
-        if edge_cuts_found and min_x != float("inf"):
-            self.board_width_mm = self.round_value(max_x - min_x)
-            self.board_height_mm = self.round_value(max_y - min_y)
+        if edge_bbox is None:
+            edge_bbox = self._edge_cuts_bbox()
+        
+        if edge_bbox is not None:
+            min_x, min_y, max_x, max_y = edge_bbox
+            self.board_width_mm = _round_mm(max_x - min_x)
+            self.board_height_mm = _round_mm(max_y - min_y)
             logger.debug(f"Detected Edge.Cuts dimensions: {self.board_width_mm:.2f} x {self.board_height_mm:.2f} mm")
         else:
             logger.warning("No Edge.Cuts layer found - cannot determine board dimensions")
@@ -764,12 +917,9 @@ class GenFixture:
         """Format test points as OpenSCAD array string"""
         if points is None:
             points = self.test_points
-        if len(points) == 0:
-            return "[]"
-        tps = "["
-        for tp in points:
-            tps += f"[{tp[0]:.02f},{tp[1]:.02f}],"
-        return tps[:-1] + "]"
+        # Format every coordinate with one %-operation over the flattened list
+        template = ",".join(["[%.2f,%.2f]"] * len(points))
+        return "[" + template % tuple(chain.from_iterable(points)) + "]"
     
     def generate(self, path: str):
         """
@@ -778,8 +928,22 @@ class GenFixture:
         Args:
             path: Output directory path
         """
+        import pcbnew
+        
         logger.info("Starting fixture generation...")
         
+        # Find OpenSCAD executable first - no point exporting DXFs if it is missing
+        openscad_exe = _find_openscad()
+        if not openscad_exe:
+            logger.error("OpenSCAD not found! Please install OpenSCAD from https://openscad.org/")
+            return False
+        
+        # Find openfixture.scad (should be in same directory as this script)
+        scad_file = SCAD_FILE
+        if not scad_file.exists():
+            logger.error(f"openfixture.scad not found at {scad_file}")
+            return False
+        
         # Get origin and board dimensions
         self.get_origin_dimensions()
         
@@ -801,70 +965,78 @@ class GenFixture:
             logger.error("or use the --flayer option to force test points")
             return False
         
-        # Plot DXF files
-        self.plot_dxf(path, "outline")
+        # Plot DXF files (plot controller and options are configured once for both exports)
+        self._setup_plotter(path)
+        try:
+            self.plot_dxf(path, "outline")
+            self.plot_dxf(path, "track")
+        finally:
+            self._close_plotter()
+        
         outline_file = os.path.join(path, f"{self.prj_name}-outline.dxf")
         if os.path.exists(outline_file):
             logger.info(f"Exported DXF: outline ({os.path.getsize(outline_file)} bytes)")
         else:
             logger.error(f"Failed to export outline DXF to {outline_file}")
         
-        self.plot_dxf(path, "track")
-        
         # Get revision
         if self.config.rev is None:
             rev = self.brd.GetTitleBlock().GetRevision()
             self.config.rev = f"rev.{rev}" if rev else "rev.0"
         
-        # Build OpenSCAD command arguments
-        args_dict = self._build_openscad_args(path)
+        # Build OpenSCAD parameter definitions (once, shared by every OpenSCAD run)
+        defines = self._build_openscad_args(path)
         
         # Create output file names
-        if os.name == 'nt':
-            dxfout = os.path.join(path, f"{self.prj_name}-fixture.dxf")
-            pngout = os.path.join(path, f"{self.prj_name}-fixture.png")
-            testout = os.path.join(path, f"{self.prj_name}-test.dxf")
-        else:
-            dxfout = f"{path}/{self.prj_name}-fixture.dxf"
-            pngout = f"{path}/{self.prj_name}-fixture.png"
-            testout = f"{path}/{self.prj_name}-test.dxf"
-        
-        # Find OpenSCAD executable
-        openscad_exe = self._find_openscad()
-        if not openscad_exe:
-            logger.error("OpenSCAD not found! Please install OpenSCAD from https://openscad.org/")
-            return False
-        
-        # Find openfixture.scad (should be in same directory as this script)
-        script_dir = Path(__file__).parent
-        scad_file = script_dir / "openfixture.scad"
-        if not scad_file.exists():
-            logger.error(f"openfixture.scad not found at {scad_file}")
-            return False
+        dxfout = os.path.join(path, f"{self.prj_name}-fixture.dxf")
+        pngout = os.path.join(path, f"{self.prj_name}-fixture.png")
+        testout = os.path.join(path, f"{self.prj_name}-test.dxf")
         
         # Generate fixture files
         logger.info("Generating fixture with OpenSCAD...")
         
-        # Run OpenSCAD commands with error checking
+        # Run the three independent OpenSCAD jobs concurrently (separate processes,
+        # so wall time is that of the slowest job - usually the 3D render)
         success = True
-        
-        # Generate test cut
-        logger.info("Generating test cut DXF...")
-        if not self._run_openscad(openscad_exe, scad_file, args_dict, "testcut", testout):
-            logger.error("Failed to generate test cut DXF")
-            success = False
-        
-        # Generate 3D preview
-        logger.info("Generating 3D preview PNG...")
-        if not self._run_openscad(openscad_exe, scad_file, args_dict, "3dmodel", pngout, render=True):
-            logger.warning("Failed to generate 3D preview PNG")
-            # Don't fail on preview - continue
-        
-        # Generate fixture DXF
-        logger.info("Generating fixture DXF...")
-        if not self._run_openscad(openscad_exe, scad_file, args_dict, "lasercut", dxfout):
-            logger.error("Failed to generate fixture DXF")
-            success = False
+        logger.info("Generating test cut DXF, 3D preview PNG and fixture DXF...")
+        
+        # Parameters go into a stub .scad file rather than -D arguments, so large
+        # test point arrays cannot hit the Windows 32k command line limit
+        stub_file = self._write_param_stub(scad_file, defines)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            test_future = executor.submit(self._run_openscad, openscad_exe, stub_file,
+                                          "testcut", testout)
+            png_future = executor.submit(self._run_openscad, openscad_exe, stub_file,
+                                         "3dmodel", pngout, render=True)
+            dxf_future = executor.submit(self._run_openscad, openscad_exe, stub_file,
+                                         "lasercut", dxfout)
+            try:
+                # Generate test cut
+                if not test_future.result():
+                    logger.error("Failed to generate test cut DXF")
+                    success = False
+                
+                # Generate 3D preview
+                if not png_future.result():
+                    logger.warning("Failed to generate 3D preview PNG")
+                    # Don't fail on preview - continue
+                
+                # Generate fixture DXF
+                if not dxf_future.result():
+                    logger.error("Failed to generate fixture DXF")
+                    success = False
+            except KeyboardInterrupt:
+                # Drop jobs that have not started; running OpenSCAD children get the same Ctrl-C
+                for future in (test_future, png_future, dxf_future):
+                    future.cancel()
+                raise
+            finally:
+                executor.shutdown(wait=True)
+                try:
+                    os.unlink(stub_file)
+                except OSError:
+                    pass
         
         if success:
             logger.info(f"Fixture generated: {dxfout}")
@@ -873,8 +1045,13 @@ class GenFixture:
         
         return success
     
-    def _build_openscad_args(self, path: str) -> str:
-        """Build OpenSCAD command line arguments"""
+    def _build_openscad_args(self, path: str) -> List[str]:
+        """
+        Build OpenSCAD parameter definitions
+        
+        Returns:
+            List of 'key=value' definitions with values already quoted/escaped
+        """
         
         # Common args - use Edge.Cuts dimensions if available, otherwise use calculated dims
         pcb_x = self.board_width_mm if self.board_width_mm > 0 else self.dims[0]
@@ -897,13 +1074,14 @@ class GenFixture:
         args_dict['test_points_top'] = self.get_test_point_str(self.test_points_top)
         args_dict['test_points_bottom'] = self.get_test_point_str(self.test_points_bottom)
         
-        # Debug: Log the test point arrays being passed
-        logger.debug(f"Passing test_points_top array with {len(self.test_points_top)} points")
-        logger.debug(f"Passing test_points_bottom array with {len(self.test_points_bottom)} points")
-        if len(self.test_points_top) > 0:
-            logger.debug(f"First top point: {self.test_points_top[0]}, Last top point: {self.test_points_top[-1]}")
-        if len(self.test_points_bottom) > 0:
-            logger.debug(f"First bottom point: {self.test_points_bottom[0]}, Last bottom point: {self.test_points_bottom[-1]}")
+        # Debug: Log the test point arrays being passed (skipped unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Passing test_points_top array with {len(self.test_points_top)} points")
+            logger.debug(f"Passing test_points_bottom array with {len(self.test_points_bottom)} points")
+            if len(self.test_points_top) > 0:
+                logger.debug(f"First top point: {self.test_points_top[0]}, Last top point: {self.test_points_top[-1]}")
+            if len(self.test_points_bottom) > 0:
+                logger.debug(f"First bottom point: {self.test_points_bottom[0]}, Last bottom point: {self.test_points_bottom[-1]}")
         
         # Path separators - store raw paths, quoting happens in command builder
         outline_path = os.path.join(path, f"{self.prj_name}-outline.dxf").replace("\\", "/")
@@ -927,7 +1105,7 @@ class GenFixture:
         if title and title.strip():
             # Sanitize title: limit length for engraving readability
             # Allowed: letters, numbers, spaces, colons, and most punctuation
-            # Escaping of quotes/backslashes happens in _run_openscad()
+            # Escaping of quotes/backslashes happens in _format_openscad_value()
             sanitized_title = title.strip()[:50]  # Max 50 chars fits on fixture plate
             args_dict['title'] = sanitized_title
         if self.config.washer_th:
@@ -946,7 +1124,7 @@ class GenFixture:
             args_dict['pogo_uncompressed_length'] = f"{float(self.config.pogo_uncompressed_length):.02f}"
         
         # Logo parameters
-        args_dict['logo_enable'] = "1" if self.config.logo_enable else "0"
+        args_dict['logo_enable'] = self.config.logo_enable_str
         if self.config.logo_file:
             args_dict['logo_file'] = self.config.logo_file
         if self.config.logo_scale_x is not None:
@@ -962,58 +1140,52 @@ class GenFixture:
         if self.config.logo_offset_z is not None:
             args_dict['logo_offset_z'] = f"{float(self.config.logo_offset_z):.02f}"
         
-        # Log critical parameters for debugging
-        logger.debug(f"OpenSCAD parameters:")
-        logger.debug(f"  pcb_outline: {args_dict.get('pcb_outline', 'NOT SET')}")
-        logger.debug(f"  pcb_x: {args_dict.get('pcb_x', 'NOT SET')} (from {'Edge.Cuts' if self.board_width_mm > 0 else 'calculated'})")
-        logger.debug(f"  pcb_y: {args_dict.get('pcb_y', 'NOT SET')} (from {'Edge.Cuts' if self.board_height_mm > 0 else 'calculated'})")
-        logger.debug(f"  pcb_support_border: {args_dict.get('pcb_support_border', 'NOT SET')}")
-        logger.debug(f"  test_points_top count: {len(self.test_points_top)}")
-        logger.debug(f"  test_points_bottom count: {len(self.test_points_bottom)}")
-        
-        # Return args_dict for command builder to handle properly
-        return args_dict
-
-    def _find_openscad(self) -> Optional[str]:
-        """Find OpenSCAD executable"""
-        # Try to find in PATH
-        openscad = shutil.which('openscad')
-        if openscad:
-            return openscad
-        
-        # Common Windows installation paths
-        if os.name == 'nt':
-            common_paths = [
-                r"C:\Program Files\OpenSCAD\openscad.exe",
-                r"C:\Program Files (x86)\OpenSCAD\openscad.exe",
-                os.path.expanduser(r"~\AppData\Local\Programs\OpenSCAD\openscad.exe"),
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    return path
+        # Log critical parameters for debugging (skipped unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OpenSCAD parameters:")
+            logger.debug(f"  pcb_outline: {args_dict.get('pcb_outline', 'NOT SET')}")
+            logger.debug(f"  pcb_x: {args_dict.get('pcb_x', 'NOT SET')} (from {'Edge.Cuts' if self.board_width_mm > 0 else 'calculated'})")
+            logger.debug(f"  pcb_y: {args_dict.get('pcb_y', 'NOT SET')} (from {'Edge.Cuts' if self.board_height_mm > 0 else 'calculated'})")
+            logger.debug(f"  pcb_support_border: {args_dict.get('pcb_support_border', 'NOT SET')}")
+            logger.debug(f"  test_points_top count: {len(self.test_points_top)}")
+            logger.debug(f"  test_points_bottom count: {len(self.test_points_bottom)}")
+        
+        # Quote once here so each OpenSCAD run reuses the same definitions
+        return [f'{key}={_format_openscad_value(value)}' for key, value in args_dict.items()]
+    
+    def _write_param_stub(self, scad_file: Path, defines: List[str]) -> str:
+        """
+        Write a temporary .scad file that includes openfixture.scad and assigns all parameters
         
-        # Common Linux/Mac paths
-        else:
-            common_paths = [
-                "/usr/bin/openscad",
-                "/usr/local/bin/openscad",
-                "/opt/openscad/bin/openscad",
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    return path
+        Assignments follow the include so they override the defaults in
+        openfixture.scad, exactly like -D definitions appended by OpenSCAD.
         
-        return None
-    
-    def _run_openscad(self, openscad_exe: str, scad_file: Path, args_dict: Dict, 
-                      mode: str, output: str, render: bool = False) -> bool:
+        Args:
+            scad_file: Path to openfixture.scad
+            defines: 'key=value' definitions from _build_openscad_args()
+        
+        Returns:
+            Path of the stub file (caller deletes it)
+        """
+        import tempfile
+        
+        include_path = str(scad_file.resolve()).replace("\\", "/")
+        with tempfile.NamedTemporaryFile('w', suffix='.scad', prefix=f'{self.prj_name}-',
+                                         delete=False, encoding='utf-8') as f:
+            f.write(f"include <{include_path}>\n")
+            f.write("".join(f"{define};\n" for define in defines))
+        
+        logger.debug(f"Wrote OpenSCAD parameter stub with {len(defines)} parameters: {f.name}")
+        return f.name
+
+    def _run_openscad(self, openscad_exe: str, scad_file: str, mode: str, output: str,
+                      render: bool = False) -> bool:
         """
         Run OpenSCAD command with error checking
         
         Args:
             openscad_exe: Path to OpenSCAD executable
-            scad_file: Path to openfixture.scad
-            args_dict: Dictionary of OpenSCAD parameters
+            scad_file: Parameter stub from _write_param_stub() (includes openfixture.scad)
             mode: OpenSCAD mode ('testcut', '3dmodel', 'lasercut')
             output: Output file path
             render: Whether to use --render flag
@@ -1021,51 +1193,26 @@ class GenFixture:
         Returns:
             True if successful, False otherwise
         """
-        # Build command list for subprocess (avoids shell quoting issues)
-        cmd = [str(openscad_exe)]
-        
-        if render:
-            cmd.append('--render')
-        
-        # Add mode parameter
-        cmd.extend(['-D', f'mode="{mode}"'])
-        
-        # Add all other parameters
-        for key, value in args_dict.items():
-            if isinstance(value, str):
-                # Check if it's an array literal (starts with '[')
-                if value.strip().startswith('['):
-                    # Array - no quotes
-                    cmd.extend(['-D', f'{key}={value}'])
-                else:
-                    # Check if it's a numeric string (e.g., "3.00", "12.31")
-                    try:
-                        float(value)
-                        # Numeric string - no quotes (OpenSCAD needs bare numbers)
-                        cmd.extend(['-D', f'{key}={value}'])
-                    except ValueError:
-                        # Non-numeric string - escape and add quotes
-                        # Escape backslashes first, then quotes (order matters!)
-                        escaped_value = value.replace('\\', '\\\\').replace('"', '\\"')
-                        cmd.extend(['-D', f'{key}="{escaped_value}"'])
-            else:
-                # Numeric value - no quotes
-                cmd.extend(['-D', f'{key}={value}'])
+        import subprocess
         
-        # Add output and input files
-        cmd.extend(['-o', str(output), str(scad_file)])
+        # Build command list for subprocess (avoids shell quoting issues)
+        cmd = ([str(openscad_exe)]
+               + (['--render'] if render else [])
+               + ['-D', f'mode="{mode}"']
+               + ['-o', str(output), str(scad_file)])
         
-        logger.info(f"Running OpenSCAD command with {len(args_dict)} parameters")
+        logger.info(f"Running OpenSCAD command (mode={mode})")
         logger.debug(f"OpenSCAD command: {' '.join(cmd)}")
         
         try:
             # Use subprocess with list (no shell) to avoid quoting issues
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            # stdout is never inspected; stderr is kept as bytes and only decoded on failure
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
             
             if result.returncode != 0:
                 logger.error(f"OpenSCAD failed with return code {result.returncode}")
                 if result.stderr:
-                    logger.error(f"OpenSCAD error: {result.stderr}")
+                    logger.error(f"OpenSCAD error: {result.stderr.decode('utf-8', 'replace')}")
                 return False
             
             # Check if output file was created
@@ -1146,12 +1293,14 @@ def main():
     # Convert output path to absolute
     out_dir = os.path.abspath(args.out)
     
+    # Create output directory if needed (also required for the verbose log file)
+    os.makedirs(out_dir, exist_ok=True)
+    
     # Set logging level and add file handler if verbose
     if args.verbose:
         logger.setLevel(logging.DEBUG)
         
         # Create log file in output directory
-        os.makedirs(out_dir, exist_ok=True)
         from datetime import datetime
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = os.path.join(out_dir, f'openfixture_{timestamp}.log')
@@ -1165,11 +1314,6 @@ def main():
         
         logger.info(f"Verbose logging enabled - writing to: {log_file}")
     
-    # Create output directory if needed
-    if not os.path.exists(out_dir):
-        os.makedirs(out_dir)
-        logger.info(f"Created output directory: {out_dir}")
-    
     # Load configuration
     if args.config and Path(args.config).exists():
         config = FixtureConfig.from_toml(args.config)
@@ -1218,7 +1362,9 @@ def main():
         config.include_smd = True
         config.include_pth = True
     
-    # Load board file
+    # Load board file (first use of pcbnew - keeps --help fast)
+    import pcbnew
+    
     try:
         logger.info(f"Loading board file: {args.board}")
         brd = pcbnew.LoadBoard(args.board)